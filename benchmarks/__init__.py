@@ -0,0 +1,2 @@
+from .graphs import SHAPES
+from .runner import BenchmarkResult, run_benchmark, compare
@@ -0,0 +1,54 @@
+import argparse
+import json
+import sys
+
+from .graphs import SHAPES
+from .runner import run_benchmark, compare
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Bootstrap benchmarks for pid.')
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES), default=sorted(SHAPES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', metavar='PATH', help='write results as a baseline json file')
+    parser.add_argument('--compare', metavar='PATH', help='compare results with a baseline json file')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression')
+    args = parser.parse_args()
+
+    results = []
+
+    print(f'{"benchmark":<24} {"bootstrap ms":>13} {"peak KiB":>10} {"lookup ns":>10}')
+    for shape in args.shapes:
+        for size in args.sizes:
+            try:
+                result = run_benchmark(shape, SHAPES[shape], size, args.repeat)
+            except RecursionError:
+                print(f'{f"{shape}/{size}":<24} skipped: graph is deeper than the interpreter stack allows')
+                continue
+
+            results.append(result)
+            print(
+                f'{result.key:<24} {result.bootstrap_seconds * 1e3:>13.3f} '
+                f'{result.peak_memory_bytes / 1024:>10.1f} {result.lookup_seconds * 1e9:>10.1f}'
+            )
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({result.key: result._asdict() for result in results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from itertools import count
+from types import new_class
+from typing import Any, Callable
+
+from pid import Pid
+
+__all__ = [
+    'SHAPES',
+    'deep_chain',
+    'wide',
+    'rhombus',
+    'reexport_chain',
+    'aliases',
+]
+
+_unique = count()
+
+
+def _name(prefix: str) -> str:
+    return f'{prefix}{next(_unique)}'
+
+
+def _make_class(prefix: str, dependencies: dict[str, Any] = None, bases: tuple[type, ...] = ()) -> type:
+    dependencies = dependencies or {}
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    __init__.__annotations__ = dict(dependencies)
+
+    return new_class(_name(prefix), bases, exec_body=lambda namespace: namespace.update(__init__=__init__))
+
+
+def _provider(prefix: str, dependencies: dict[str, Any] = None, bases: tuple[type, ...] = ()) -> type:
+    return Pid.injectable()(_make_class(prefix, dependencies, bases))
+
+
+def _module(prefix: str, dependencies: dict[str, Any] = None, **declaration: Any) -> type:
+    return Pid.module(**declaration)(_make_class(prefix, dependencies))
+
+
+def deep_chain(size: int) -> type:
+    module = None
+    provider = None
+
+    for _ in range(size):
+        dependencies = {'previous': provider} if provider is not None else {}
+        provider = _provider('ChainProvider', dependencies)
+        module = _module(
+            'ChainModule',
+            imports=[module] if module is not None else [],
+            providers=[provider],
+            exports=[provider],
+        )
+
+    return _module('ChainRoot', {'last': provider}, imports=[module])
+
+
+def wide(size: int) -> type:
+    providers = [_provider('WideProvider') for _ in range(size)]
+
+    return _module(
+        'WideRoot',
+        {f'provider_{index}': provider for index, provider in enumerate(providers)},
+        providers=providers,
+    )
+
+
+def rhombus(size: int) -> type:
+    top_provider = _provider('RhombusProvider')
+    top_module = _module('RhombusTop', providers=[top_provider], exports=[top_provider])
+
+    middle_modules = [
+        _module('RhombusModule', {'provider': top_provider}, imports=[top_module])
+        for _ in range(size)
+    ]
+
+    return _module('RhombusRoot', imports=middle_modules)
+
+
+def reexport_chain(size: int) -> type:
+    provider = _provider('ReexportProvider')
+    module = _module('ReexportSource', providers=[provider], exports=[provider])
+
+    for _ in range(size):
+        module = _module('ReexportModule', imports=[module], exports=[module])
+
+    return _module('ReexportRoot', {'provider': provider}, imports=[module])
+
+
+def aliases(size: int) -> type:
+    class Interface[T]: ...
+
+    models = [type(_name('AliasModel'), (), {}) for _ in range(size)]
+    providers = [_provider('AliasProvider', bases=(Interface[model],)) for model in models]
+
+    return _module(
+        'AliasRoot',
+        {f'provider_{index}': Interface[model] for index, model in enumerate(models)},
+        providers=providers,
+    )
+
+
+SHAPES: dict[str, Callable[[int], type]] = {
+    'deep_chain': deep_chain,
+    'wide': wide,
+    'rhombus': rhombus,
+    'reexport_chain': reexport_chain,
+    'aliases': aliases,
+}
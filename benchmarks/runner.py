@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from pid import BootStrap, Container
+from pid.bootstrap.utils import get_metadata
+
+__all__ = [
+    'BenchmarkResult',
+    'run_benchmark',
+    'compare',
+]
+
+LOOKUP_ROUNDS = 100
+
+
+class BenchmarkResult(NamedTuple):
+    shape: str
+    size: int
+    bootstrap_seconds: float
+    peak_memory_bytes: int
+    lookup_seconds: float
+
+    @property
+    def key(self) -> str:
+        return f'{self.shape}/{self.size}'
+
+
+def run_benchmark(shape: str, make_graph: Callable[[int], type], size: int, repeat: int) -> BenchmarkResult:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), size * 50))
+
+    timings = []
+    for _ in range(repeat):
+        root = make_graph(size)
+        started = perf_counter()
+        BootStrap.resolve(root)
+        timings.append(perf_counter() - started)
+
+    root = make_graph(size)
+    tracemalloc.start()
+    try:
+        BootStrap.resolve(root)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        shape=shape,
+        size=size,
+        bootstrap_seconds=statistics.median(timings),
+        peak_memory_bytes=peak_memory,
+        lookup_seconds=_measure_lookup(make_graph(size)),
+    )
+
+
+def _measure_lookup(root: type) -> float:
+    providable = get_metadata(root).make_providable(Container())
+    providable.resolve()
+
+    pool = providable._make_child_providers_pool()
+    markers = [dependency.marker for dependency in get_metadata(root).dependencies.values()]
+    if not markers:
+        return 0.0
+
+    started = perf_counter()
+    for _ in range(LOOKUP_ROUNDS):
+        for marker in markers:
+            pool.find(marker)
+
+    return (perf_counter() - started) / (LOOKUP_ROUNDS * len(markers))
+
+
+def compare(
+        results: list[BenchmarkResult],
+        baseline: dict[str, dict[str, Any]],
+        threshold: float,
+) -> list[str]:
+    regressions = []
+
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+
+        for metric in ('bootstrap_seconds', 'peak_memory_bytes', 'lookup_seconds'):
+            before = reference[metric]
+            after = getattr(result, metric)
+
+            if before and (after - before) / before > threshold:
+                regressions.append(f'{result.key} {metric}: {before:.6g} -> {after:.6g}')
+
+    return regressions
@@ -1,3 +1,12 @@
 from .bootstrap import BootStrap
 from .decorators import Pid
 from .provider import Provider
+from .scope import Scope
+from .lazy import Lazy
+from .factory import Factory
+from .pooled import Pooled, PoolStats
+from .shared import PoolSpec
+from .profiler import Profiler
+from .container import Container
+from .cache import GraphCache
+from .manifest import Manifest
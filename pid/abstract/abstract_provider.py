@@ -1,15 +1,50 @@
 from __future__ import annotations
 
-from typing import Any, get_type_hints, get_origin, get_args, Callable, Optional
+import asyncio
+from contextlib import nullcontext
+from inspect import isasyncgen, isawaitable, isgenerator
+from time import perf_counter
+from typing import Any, Awaitable, Callable, ContextManager, Iterable, NoReturn, Optional
 
+from ..bootstrap.utils import get_metadata
+from ..factory import Factory
+from ..lazy import Lazy
+from ..pooled import Pooled
 from ..pools import ProvidersPool
-from ..shared import IProvider, Dependency, CannotResolveDependency, ResolveTreeMetadata
+from ..shared import (
+    IProvider, IPlanCompiler,
+    Dependency, DependencyKind,
+    CannotResolveDependency, CircularDependency, UnsupportedFactory, ResolveTreeMetadata,
+    sizeof,
+)
+
+_NOT_PROFILED = nullcontext()
+
+
+def _discard(result: Any) -> None:
+    close = getattr(result, 'close', None)
+
+    if close is not None:
+        close()
 
 
 class AbstractProvider[T](IProvider[T]):
+    __slots__ = (
+        'class_',
+        '_container',
+        '_providers',
+        '_resolving',
+        '_lock',
+        '_own_providers_pool',
+        '_inherit_providers_pool',
+    )
+
     _own_providers_pool: ProvidersPool
     _inherit_providers_pool: ProvidersPool
     _factory: Optional[Callable[[*Any], T]]
+    _providers: list[IProvider]
+    _scope: Optional[str] = None
+    after_fork = 'keep'
 
     def resolve(
             self,
@@ -20,45 +55,273 @@ class AbstractProvider[T](IProvider[T]):
     def _resolve(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> T:
         raise NotImplementedError
 
+    async def aresolve(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> T:
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata(waits={})
+
+        return await self._aresolve(resolve_tree_metadata)
+
+    async def _aresolve(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> T:
+        raise NotImplementedError
+
+    async def _await_resolving(self, resolving: Awaitable[T], resolve_tree_metadata: ResolveTreeMetadata) -> T:
+        waits = resolve_tree_metadata.waits
+        if waits is None or resolve_tree_metadata.chain is None:
+            return await resolving
+
+        cycle = resolve_tree_metadata.find_wait_cycle(self)
+        if cycle is not None:
+            self._raise_circular_dependency(resolve_tree_metadata, cycle)
+
+        awaited = waits.setdefault(resolve_tree_metadata.chain.provider, [])
+        awaited.append(self)
+        try:
+            return await resolving
+        finally:
+            awaited.remove(self)
+
+    def compile(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> int:
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata()
+
+        return self._compile(compiler, resolve_tree_metadata)
+
+    def _compile(self, compiler: IPlanCompiler, resolve_tree_metadata: ResolveTreeMetadata = None) -> int:
+        raise NotImplementedError
+
+    def compile_factory(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+            kind: DependencyKind = DependencyKind.FACTORY,
+    ) -> int:
+        raise NotImplementedError
+
+    def make_factory(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> Callable[..., T]:
+        raise NotImplementedError
+
+    def get_pool(self) -> Pooled[T]:
+        raise NotImplementedError
+
     def _prepare(
             self,
             resolve_tree_metadata: ResolveTreeMetadata = None,
+            dependencies_items: Optional[Iterable[tuple[str, Dependency]]] = None,
+    ) -> dict[str, Any]:
+        dependencies = {}
+        profiler = resolve_tree_metadata.profiler
+        edges = self._make_dependency_edges()
+
+        if dependencies_items is None:
+            dependencies_items = self.dependencies.items()
+
+        for key, dependency in dependencies_items:
+            if profiler is None:
+                provider = self._get_provider_from_pools(dependency.marker, key, resolve_tree_metadata)
+            else:
+                started = perf_counter()
+                provider = self._get_provider_from_pools(dependency.marker, key, resolve_tree_metadata)
+                profiler.add_lookup_time(perf_counter() - started)
+
+            if edges is not None:
+                edges.append((dependency.marker, provider))
+
+            if dependency.kind is DependencyKind.RAW:
+                dependencies[key] = provider
+            elif dependency.kind is DependencyKind.LAZY:
+                dependencies[key] = Lazy(provider)
+            elif dependency.kind is DependencyKind.FACTORY:
+                dependencies[key] = Factory(provider)
+            elif dependency.kind is DependencyKind.POOLED:
+                dependencies[key] = provider.get_pool()
+            else:
+                dependencies[key] = provider.resolve(resolve_tree_metadata)
+
+        if edges is not None:
+            self._container.record_dependencies(self, edges)
+
+        return dependencies
+
+    async def _aprepare(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> dict[str, Any]:
         dependencies = {}
+        pending = {}
+        edges = self._make_dependency_edges()
 
         for key, dependency in self.dependencies.items():
             provider = self._get_provider_from_pools(dependency.marker, key, resolve_tree_metadata)
 
-            if dependency.raw:
+            if edges is not None:
+                edges.append((dependency.marker, provider))
+
+            if dependency.kind is DependencyKind.RAW:
                 dependencies[key] = provider
+            elif dependency.kind is DependencyKind.LAZY:
+                dependencies[key] = Lazy(provider)
+            elif dependency.kind is DependencyKind.FACTORY:
+                dependencies[key] = Factory(provider)
+            elif dependency.kind is DependencyKind.POOLED:
+                dependencies[key] = provider.get_pool()
             else:
-                dependencies[key] = provider.resolve(resolve_tree_metadata)
+                pending[key] = provider.aresolve(resolve_tree_metadata)
+
+        resolved = await asyncio.gather(*pending.values())
+        dependencies.update(zip(pending.keys(), resolved))
+
+        if edges is not None:
+            self._container.record_dependencies(self, edges)
 
         return dependencies
 
+    def _make_dependency_edges(self) -> Optional[list[tuple[Any, IProvider]]]:
+        if self._container is None or self._container.has_dependencies(self):
+            return None
+
+        return []
+
+    def _compile_step(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+            kind: DependencyKind = DependencyKind.VALUE,
+    ) -> int:
+        arguments = {}
+        handles = {}
+
+        for key, dependency in self.dependencies.items():
+            provider = self._get_provider_from_pools(dependency.marker, key, resolve_tree_metadata)
+
+            if dependency.kind is DependencyKind.FACTORY or dependency.kind is DependencyKind.POOLED:
+                arguments[key] = provider.compile_factory(compiler, resolve_tree_metadata, dependency.kind)
+                continue
+
+            slot = provider.compile(compiler, resolve_tree_metadata)
+
+            if dependency.kind is DependencyKind.VALUE:
+                arguments[key] = slot
+            else:
+                handles[key] = (slot, dependency.kind)
+
+        return compiler.add_step(self, arguments, handles, kind)
+
     def _get_provider_from_pools(
             self,
             marker: Any,
             dependency_key: str,
             resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> Any:
-        if self._own_providers_pool.has(marker):
-            return self._own_providers_pool.get(marker)
-        elif self._inherit_providers_pool.has(marker):
-            return self._inherit_providers_pool.get(marker)
-        else:
-            chain_str = "\n".join(
-                '\t' * i + f'^- {elem}' for i, elem in enumerate(reversed(resolve_tree_metadata.chain)))
+        if self._container is not None and self._container.overrides:
+            provider = self._container.find_override(marker, self._make_child_providers_pool())
+            if provider is not None:
+                return provider
 
+        provider = self._make_child_providers_pool().find(marker)
+
+        if provider is not None:
+            return provider
+        else:
             raise CannotResolveDependency(
                 f'Error while trying resolving dependency:\n'
                 f'{self.name}(..., {dependency_key}={marker!r}, ...)\n'
-                f'{chain_str}'
+                f'{self._render_chain(resolve_tree_metadata)}'
             )
 
+    def _raise_circular_dependency(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata,
+            cycle: Optional[list[str]] = None,
+    ) -> NoReturn:
+        cycle = cycle or resolve_tree_metadata.find_cycle(self) or [self.name]
+
+        raise CircularDependency(
+            f'Circular dependency detected:\n'
+            f'{" -> ".join([*cycle, self.name])}\n'
+            f'{self._render_chain(resolve_tree_metadata)}'
+        )
+
+    @staticmethod
+    def _render_chain(resolve_tree_metadata: ResolveTreeMetadata) -> str:
+        return "\n".join(
+            '\t' * i + f'^- {elem}' for i, elem in enumerate(reversed(resolve_tree_metadata.names)))
+
     def _provide(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> T:
+        if resolve_tree_metadata.stats is not None:
+            resolve_tree_metadata.stats.resolved += 1
+
         dependencies = self._prepare(resolve_tree_metadata)
-        return self.factory(**dependencies)
+
+        if resolve_tree_metadata.profiler is None:
+            return self._call_factory(dependencies)
+
+        with resolve_tree_metadata.profiler.measure_factory():
+            return self._call_factory(dependencies)
+
+    def _call_factory(self, dependencies: dict[str, Any]) -> T:
+        result = self.factory(**dependencies)
+
+        if isgenerator(result):
+            instance = next(result)
+            self._register_resource(result)
+            return instance
+        elif isasyncgen(result) or isawaitable(result):
+            _discard(result)
+            raise UnsupportedFactory(f'{self.name} has an async factory, resolve it with aresolve()')
+
+        return result
+
+    def _register_resource(self, resource: Any) -> None:
+        if self._container is not None:
+            self._container.register_resource(self, resource)
+
+    def _profile(self, resolve_tree_metadata: ResolveTreeMetadata) -> ContextManager:
+        profiler = resolve_tree_metadata.profiler
+
+        if profiler is None:
+            return _NOT_PROFILED
+
+        return profiler.measure(self, resolve_tree_metadata.names)
+
+    def _profile_hit(self, resolve_tree_metadata: ResolveTreeMetadata) -> None:
+        if resolve_tree_metadata.profiler is not None:
+            resolve_tree_metadata.profiler.hit(self)
+
+        if resolve_tree_metadata.stats is not None:
+            resolve_tree_metadata.stats.hits += 1
+
+    async def _aprovide(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> T:
+        if resolve_tree_metadata.stats is not None:
+            resolve_tree_metadata.stats.resolved += 1
+
+        dependencies = await self._aprepare(resolve_tree_metadata)
+
+        if resolve_tree_metadata.limiter is None:
+            return await self._acall_factory(dependencies)
+
+        async with resolve_tree_metadata.limiter:
+            return await self._acall_factory(dependencies)
+
+    async def _acall_factory(self, dependencies: dict[str, Any]) -> T:
+        result = self.factory(**dependencies)
+
+        if isasyncgen(result):
+            instance = await anext(result)
+            self._register_resource(result)
+            return instance
+        elif isgenerator(result):
+            instance = next(result)
+            self._register_resource(result)
+            return instance
+        elif isawaitable(result):
+            result = await result
+
+        return result
 
     @property
     def factory(self) -> Callable[[*Any], T]:
@@ -69,33 +332,41 @@ class AbstractProvider[T](IProvider[T]):
         else:
             return self._factory
 
+    def invalidate(self) -> None:
+        raise NotImplementedError
+
+    def reset_after_fork(self) -> None:
+        self._lock.reset()
+        self._resolving = None
+
+    def sizeof(self) -> int:
+        size = sizeof(self)
+
+        if self._own_providers_pool is not self._inherit_providers_pool:
+            size += self._own_providers_pool.sizeof()
+
+        return size
+
+    @property
+    def inherit_providers_pool(self) -> ProvidersPool:
+        return self._inherit_providers_pool
+
+    @property
+    def providers(self) -> tuple[IProvider, ...]:
+        return tuple(self._providers)
+
+    @property
+    def scope(self) -> Optional[str]:
+        return self._scope
+
     @property
     def name(self) -> str:
         return self.class_.__name__
 
     @property
-    def dependencies(self) -> dict[str, Dependency]:
-        try:
-            init_annotations = get_type_hints(self.provider_method)
-        except AttributeError:
-            return {}
-
-        if 'return' in init_annotations:
-            del init_annotations['return']
-
-        result = {}
-        for key, annotation in init_annotations.items():
-            origin = get_origin(annotation)
-            if origin and issubclass(origin, AbstractProvider):
-                result[key] = Dependency(
-                    marker=get_args(annotation)[0],
-                    raw=True,
-                )
-                continue
-
-            result[key] = Dependency(
-                marker=annotation,
-                raw=False
-            )
+    def aliases(self) -> tuple[Any, ...]:
+        return get_metadata(self.class_).aliases
 
-        return result
+    @property
+    def dependencies(self) -> dict[str, Dependency]:
+        return get_metadata(self.class_).dependencies
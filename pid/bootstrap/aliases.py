@@ -0,0 +1,36 @@
+from typing import Any, Generic, Protocol, Type, get_args, get_origin
+
+__all__ = [
+    'collect_aliases',
+]
+
+_SKIPPED_BASES = (object, Generic, Protocol)
+
+
+def collect_aliases(class_: Type[Any]) -> tuple[Any, ...]:
+    aliases = {class_: None}
+    _collect_bases(class_, {}, aliases)
+
+    return tuple(aliases)
+
+
+def _collect_bases(alias: Any, substitutions: dict[Any, Any], aliases: dict[Any, None]) -> None:
+    origin = get_origin(alias) or alias
+
+    for base in origin.__dict__.get('__orig_bases__', origin.__bases__):
+        base_origin = get_origin(base)
+
+        if base in _SKIPPED_BASES or base_origin in _SKIPPED_BASES:
+            continue
+
+        parameters = getattr(base, '__parameters__', ())
+        if base_origin is not None and parameters and substitutions:
+            base = base[tuple(substitutions.get(parameter, parameter) for parameter in parameters)]
+
+        if base in aliases:
+            continue
+
+        aliases[base] = None
+
+        base_substitutions = dict(zip(getattr(base_origin, '__parameters__', ()), get_args(base)))
+        _collect_bases(base, base_substitutions, aliases)
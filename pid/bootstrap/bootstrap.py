@@ -1,16 +1,68 @@
-from typing import Type
+from concurrent.futures import Executor
+from typing import Type, Optional
 
-from .utils import is_injectable, get_metadata
+from .utils import is_injectable
+from ..cache import GraphCache
+from ..container import Container, Warm
+from ..plan import ResolutionPlan
+from ..profiler import Profiler
 from ..shared import ClassIsNotInjectable
 
 
 class BootStrap:
     @classmethod
-    def resolve[T](cls, class_: Type[T]) -> T:
+    def resolve[T](
+            cls,
+            class_: Type[T],
+            executor: Optional[Executor] = None,
+            profiler: Optional[Profiler] = None,
+            container: Optional[Container] = None,
+            cache: Optional[GraphCache] = None,
+            warm: Warm = None,
+    ) -> T:
         if not is_injectable(class_):
             raise ClassIsNotInjectable(class_.__name__)
 
-        metadata = get_metadata(class_)
-        providable = metadata.make_providable()
+        container = _make_container(container, cache)
 
-        return providable.resolve()
+        return container.resolve(class_, executor=executor, profiler=profiler, warm=warm)
+
+    @classmethod
+    async def aresolve[T](
+            cls,
+            class_: Type[T],
+            concurrency: Optional[int] = None,
+            container: Optional[Container] = None,
+            cache: Optional[GraphCache] = None,
+            warm: Warm = None,
+    ) -> T:
+        if not is_injectable(class_):
+            raise ClassIsNotInjectable(class_.__name__)
+
+        container = _make_container(container, cache)
+
+        return await container.aresolve(class_, concurrency=concurrency, warm=warm)
+
+    @classmethod
+    def compile[T](
+            cls,
+            class_: Type[T],
+            container: Optional[Container] = None,
+            cache: Optional[GraphCache] = None,
+    ) -> ResolutionPlan[T]:
+        if not is_injectable(class_):
+            raise ClassIsNotInjectable(class_.__name__)
+
+        container = _make_container(container, cache)
+
+        return container.compile(class_)
+
+
+def _make_container(container: Optional[Container], cache: Optional[GraphCache]) -> Container:
+    if container is None:
+        return Container(cache=cache)
+
+    if cache is not None:
+        raise ValueError('cache cannot be passed together with a container; pass it to Container(cache=...) instead')
+
+    return container
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Callable, get_type_hints, get_origin, get_args
+
+from ..abstract import AbstractProvider
+from ..factory import Factory
+from ..lazy import Lazy
+from ..pooled import Pooled
+from ..shared import Dependency, DependencyKind
+
+__all__ = [
+    'parse_dependencies',
+]
+
+
+def parse_dependencies(method: Callable[[*Any], Any]) -> dict[str, Dependency]:
+    try:
+        init_annotations = get_type_hints(method)
+    except AttributeError:
+        return {}
+
+    if 'return' in init_annotations:
+        del init_annotations['return']
+
+    result = {}
+    for key, annotation in init_annotations.items():
+        origin = get_origin(annotation)
+        if origin and issubclass(origin, AbstractProvider):
+            result[key] = Dependency(
+                marker=get_args(annotation)[0],
+                kind=DependencyKind.RAW,
+            )
+            continue
+
+        if origin is Lazy:
+            result[key] = Dependency(
+                marker=get_args(annotation)[0],
+                kind=DependencyKind.LAZY,
+            )
+            continue
+
+        if origin is Factory:
+            result[key] = Dependency(
+                marker=get_args(annotation)[0],
+                kind=DependencyKind.FACTORY,
+            )
+            continue
+
+        if origin is Pooled:
+            result[key] = Dependency(
+                marker=get_args(annotation)[0],
+                kind=DependencyKind.POOLED,
+            )
+            continue
+
+        result[key] = Dependency(
+            marker=annotation,
+        )
+
+    return result
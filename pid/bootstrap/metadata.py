@@ -1,11 +1,29 @@
+from __future__ import annotations
+
 from typing import Any, Type, Optional, Callable
 
+from .aliases import collect_aliases
+from .dependencies import parse_dependencies
 from ..module import PidModule
 from ..provider import Provider
-from ..shared import IProvider, IMetaData
+from ..shared import IProvider, IModule, IMetaData, IContainer, AfterFork, Dependency, PoolSpec
 
 
 class MetaData[T](IMetaData[T]):
+    __slots__ = (
+        'class_',
+        'is_module',
+        'imports',
+        'exports',
+        'providers',
+        'factory',
+        'scope',
+        'pool',
+        'after_fork',
+        'aliases',
+        '_dependencies',
+    )
+
     def __init__(
             self,
             class_: Type[T],
@@ -13,7 +31,10 @@ class MetaData[T](IMetaData[T]):
             imports: list[Any] = None,
             exports: list[Any] = None,
             providers: list[Any] = None,
-            factory: Optional[Callable[[*Type[Provider]], T]] = None
+            factory: Optional[Callable[[*Type[Provider]], T]] = None,
+            scope: Optional[str] = None,
+            pool: Optional[PoolSpec] = None,
+            after_fork: AfterFork = 'keep',
     ):
         self.class_ = class_
         self.is_module = is_module
@@ -21,22 +42,54 @@ class MetaData[T](IMetaData[T]):
         self.exports = exports
         self.providers = providers
         self.factory = factory
+        self.scope = scope
+        self.pool = pool
+        self.after_fork = after_fork
+        self.aliases = collect_aliases(class_)
+
+        self._dependencies: Optional[dict[str, Dependency]] = None
 
     @property
     def name(self) -> str:
         return self.class_.__name__
 
-    def make_providable(self) -> IProvider:
+    @property
+    def provider_method(self) -> Callable[[*Any], T]:
+        if self.is_module or self.factory is None:
+            return self.class_.__init__
+        else:
+            return self.factory
+
+    @property
+    def dependencies(self) -> dict[str, Dependency]:
+        if self._dependencies is None:
+            self._dependencies = parse_dependencies(self.provider_method)
+
+        return self._dependencies
+
+    @dependencies.setter
+    def dependencies(self, dependencies: dict[str, Dependency]) -> None:
+        self._dependencies = dependencies
+
+    def make_providable(self, container: IContainer) -> IProvider:
         if self.is_module:
-            return PidModule(
-                class_=self.class_,
-                imports=self.imports,
-                providers=self.providers,
-                exports=self.exports,
-            )
+            return container.get_module(self)
         else:
             return Provider(
                 class_=self.class_,
                 providers=self.providers,
                 factory=self.factory,
+                scope=self.scope,
+                pool=self.pool,
+                after_fork=self.after_fork,
+                container=container,
             )
+
+    def make_module(self, container: IContainer) -> IModule:
+        return PidModule(
+            class_=self.class_,
+            container=container,
+            imports=self.imports,
+            providers=self.providers,
+            exports=self.exports,
+        )
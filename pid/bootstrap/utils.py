@@ -1,15 +1,41 @@
-from typing import Type
+import importlib
+from functools import cache
+from typing import Any, Type
 
 from .const import METADATA_ATTRIBUTE
 from ..shared import ClassIsNotInjectable, IMetaData
 
 
-def is_injectable[T](class_: Type[T]) -> bool:
+def is_injectable[T](class_: Type[T] | str) -> bool:
+    if isinstance(class_, str):
+        class_ = resolve_reference(class_)
+
     return hasattr(class_, METADATA_ATTRIBUTE)
 
 
-def get_metadata[T](class_: Type[T]) -> IMetaData:
+def get_metadata[T](class_: Type[T] | str) -> IMetaData:
+    if isinstance(class_, str):
+        class_ = resolve_reference(class_)
+
     if not is_injectable(class_):
         raise ClassIsNotInjectable(class_.__name__)
 
     return getattr(class_, METADATA_ATTRIBUTE)
+
+
+@cache
+def resolve_reference(reference: str) -> Any:
+    module_name, _, qualname = reference.partition(':')
+
+    try:
+        target = importlib.import_module(module_name)
+        for name in qualname.split('.'):
+            target = getattr(target, name)
+    except (ImportError, AttributeError) as error:
+        raise ClassIsNotInjectable(reference) from error
+
+    return target
+
+
+def make_reference(class_: Type[Any]) -> str:
+    return f'{class_.__module__}:{class_.__qualname__}'
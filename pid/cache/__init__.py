@@ -0,0 +1 @@
+from .graph_cache import GraphCache
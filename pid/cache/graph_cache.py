@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any, Iterator, Type, Optional
+
+from ..bootstrap.utils import get_metadata, is_injectable
+from ..shared import IMetaData, Dependency
+
+type FileStamps = dict[str, tuple[int, int]]
+
+
+class GraphCache:
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+
+    def load(self, class_: Type[Any]) -> bool:
+        try:
+            with open(self._make_file_path(class_), 'rb') as file:
+                stamps, payload = pickle.load(file)
+
+            if stamps != self._stamp_files(stamps):
+                return False
+
+            graph: dict[type, dict[str, Dependency]] = pickle.loads(payload)
+        except Exception:
+            return False
+
+        for graph_class, dependencies in graph.items():
+            get_metadata(graph_class).dependencies = dependencies
+
+        return True
+
+    def save(self, class_: Type[Any]) -> bool:
+        graph = {metadata.class_: metadata.dependencies for metadata in self._walk(get_metadata(class_))}
+
+        try:
+            payload = pickle.dumps(graph)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+        stamps = self._stamp_files(self._collect_files(graph))
+        file_path = self._make_file_path(class_)
+        temp_path = f'{file_path}.{os.getpid()}.tmp'
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump((stamps, payload), file)
+            os.replace(temp_path, file_path)
+        except OSError:
+            self._remove(temp_path)
+            return False
+
+        return True
+
+    def load_or_save(self, class_: Type[Any]) -> bool:
+        return self.load(class_) or self.save(class_)
+
+    def _make_file_path(self, class_: Type[Any]) -> str:
+        key = f'{class_.__module__}:{class_.__qualname__}:{sys.version}'
+
+        return os.path.join(self.path, f'{hashlib.sha1(key.encode()).hexdigest()}.pickle')
+
+    @staticmethod
+    def _walk(root: IMetaData) -> Iterator[IMetaData]:
+        visited = set()
+        pending = [root]
+
+        while pending:
+            metadata = pending.pop()
+            if metadata.class_ in visited:
+                continue
+
+            visited.add(metadata.class_)
+            yield metadata
+
+            for unit in (*(metadata.imports or ()), *(metadata.providers or ())):
+                if not isinstance(unit, str):
+                    pending.append(get_metadata(unit))
+
+            for dependency in metadata.dependencies.values():
+                if isinstance(dependency.marker, type) and is_injectable(dependency.marker):
+                    pending.append(get_metadata(dependency.marker))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _collect_files(graph: dict[type, dict[str, Dependency]]) -> list[str]:
+        files = set()
+
+        for graph_class in graph:
+            metadata = get_metadata(graph_class)
+            for owner in (graph_class, metadata.factory):
+                module = sys.modules.get(getattr(owner, '__module__', None))
+                file = getattr(module, '__file__', None)
+                if file is not None:
+                    files.add(file)
+
+        return sorted(files)
+
+    @staticmethod
+    def _stamp_files(files: FileStamps | list[str]) -> Optional[FileStamps]:
+        stamps = {}
+
+        for file in files:
+            try:
+                stat = os.stat(file)
+            except OSError:
+                return None
+
+            stamps[file] = (stat.st_mtime_ns, stat.st_size)
+
+        return stamps
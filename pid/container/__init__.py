@@ -0,0 +1 @@
+from .container import Container, Override, Warm
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from asyncio import Semaphore
+from concurrent.futures import Executor, Future
+from contextvars import copy_context
+from inspect import isasyncgen
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Any, Iterator, Literal, Type, Optional
+
+from ..bootstrap.utils import get_metadata
+from ..cache import GraphCache
+from ..manifest import Manifest
+from ..plan import PlanCompiler, ResolutionPlan
+from ..pools import ProvidersPool
+from ..profiler import Profiler
+from ..provider import Provider
+from ..scope import Scope
+from ..shared import (
+    IContainer, IMetaData, IModule, IProvider,
+    ContainerStats, ResolveTreeMetadata, CircularDependency, UnsupportedFactory,
+    aclose_resource, close_resource,
+)
+
+
+type Warm = Optional[Literal['eager', 'background']]
+
+_containers: weakref.WeakSet[Container] = weakref.WeakSet()
+
+
+class Container(IContainer):
+    def __init__(
+            self,
+            cache: Optional[GraphCache] = None,
+            manifest: Optional[Manifest] = None,
+            stats: bool = False,
+    ):
+        self.manifest = manifest
+        self.counters = ContainerStats() if stats else None
+        self.overrides: dict[Any, IProvider] = {}
+
+        self._cache = cache
+        self._modules: dict[type, IModule] = {}
+        self._initializing: dict[type, None] = {}
+        self._cached: set[type] = set()
+        self._dependents: dict[IProvider, set[IProvider]] = {}
+        self._marker_dependents: dict[Any, set[IProvider]] = {}
+        self._resources: list[tuple[IProvider, Any]] = []
+        self._unbound_overrides: set[IProvider] = set()
+        self._recorded: set[IProvider] = set()
+
+        self.ready: Future | asyncio.Future = Future()
+        self.ready.set_result(None)
+
+        _containers.add(self)
+
+    def get_module(self, metadata: IMetaData) -> IModule:
+        module = self._modules.get(metadata.class_)
+
+        if module is None:
+            module = self._modules[metadata.class_] = self._make_module(metadata)
+
+        return module
+
+    def _make_module(self, metadata: IMetaData) -> IModule:
+        if metadata.class_ in self._initializing:
+            cycle = [*self._initializing, metadata.class_]
+            cycle = cycle[cycle.index(metadata.class_):]
+
+            raise CircularDependency(
+                f'Circular module import detected:\n'
+                f'{" -> ".join(class_.__name__ for class_ in cycle)}'
+            )
+
+        self._initializing[metadata.class_] = None
+        try:
+            return metadata.make_module(self)
+        finally:
+            del self._initializing[metadata.class_]
+
+    def resolve[T](
+            self,
+            class_: Type[T],
+            executor: Optional[Executor] = None,
+            profiler: Optional[Profiler] = None,
+            warm: Warm = None,
+    ) -> T:
+        if executor is not None and profiler is not None:
+            raise ValueError('profiling is not supported together with an executor')
+
+        providable = self._make_providable(class_)
+
+        if executor is not None:
+            self._resolve_levels(providable, executor)
+
+        instance = providable.resolve(ResolveTreeMetadata(profiler=profiler, stats=self.counters))
+
+        if warm == 'eager':
+            self._warm()
+        elif warm == 'background':
+            self.ready = self._warm_in_background()
+
+        return instance
+
+    async def aresolve[T](
+            self,
+            class_: Type[T],
+            concurrency: Optional[int] = None,
+            warm: Warm = None,
+    ) -> T:
+        providable = self._make_providable(class_)
+
+        limiter = Semaphore(concurrency) if concurrency else None
+        resolve_tree_metadata = ResolveTreeMetadata(limiter=limiter, stats=self.counters, waits={})
+
+        instance = await providable.aresolve(resolve_tree_metadata)
+
+        if warm == 'eager':
+            await self._awarm(resolve_tree_metadata)
+        elif warm == 'background':
+            self.ready = asyncio.ensure_future(self._awarm(resolve_tree_metadata))
+
+        return instance
+
+    def _resolve_levels(self, providable: IProvider, executor: Executor) -> None:
+        compiler = PlanCompiler()
+        resolve_tree_metadata = ResolveTreeMetadata(stats=self.counters)
+        providable.compile(compiler, resolve_tree_metadata)
+
+        context = copy_context()
+
+        for level in compiler.make_levels():
+            providers = [provider for provider in level if provider.scope is None and provider is not providable]
+            list(executor.map(lambda provider: context.copy().run(provider.resolve, resolve_tree_metadata), providers))
+
+    def compile[T](self, class_: Type[T]) -> ResolutionPlan[T]:
+        providable = self._make_providable(class_)
+
+        compiler = PlanCompiler()
+        providable.compile(compiler, ResolveTreeMetadata(stats=self.counters))
+
+        return compiler.make_plan()
+
+    def override(self, marker: Any, replacement: Any) -> Override:
+        override = Override(self, marker, self.overrides.get(marker))
+        self._apply_override(marker, self._make_override_provider(marker, replacement))
+
+        return override
+
+    def find_override(self, marker: Any, pool: ProvidersPool) -> Optional[IProvider]:
+        provider = self.overrides.get(marker)
+
+        if provider is not None and provider in self._unbound_overrides:
+            original = pool.find(marker)
+            provider.set_providers_pool(pool if original is None else original.inherit_providers_pool)
+            self._unbound_overrides.discard(provider)
+
+        return provider
+
+    def has_dependencies(self, dependent: IProvider) -> bool:
+        return dependent in self._recorded
+
+    def record_dependencies(self, dependent: IProvider, edges: list[tuple[Any, IProvider]]) -> None:
+        for marker, provider in edges:
+            self._marker_dependents.setdefault(marker, set()).add(dependent)
+            self._dependents.setdefault(provider, set()).add(dependent)
+
+        self._recorded.add(dependent)
+
+    def register_resource(self, provider: IProvider, resource: Any) -> None:
+        self._resources.append((provider, resource))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        if any(isasyncgen(resource) for _, resource in self._resources):
+            raise UnsupportedFactory('Container holds async generator resources, close it with aclose()')
+
+        resources, self._resources = self._resources, []
+        blockers = self._make_shutdown_blockers(resources)
+        blocked = [len(indexes) for indexes in blockers]
+        unblocks: list[list[int]] = [[] for _ in resources]
+        for index, indexes in enumerate(blockers):
+            for blocker in indexes:
+                unblocks[blocker].append(index)
+
+        finished: SimpleQueue[tuple[int, Optional[BaseException]]] = SimpleQueue()
+        deadlines: dict[int, float] = {}
+        errors = []
+
+        def close(index: int) -> None:
+            try:
+                close_resource(*resources[index])
+            except BaseException as error:
+                finished.put((index, error))
+            else:
+                finished.put((index, None))
+
+        def start(index: int) -> None:
+            deadlines[index] = monotonic() + (timeout or 0.0)
+            threading.Thread(target=close, args=(index,), name='pid-close', daemon=True).start()
+
+        for index in range(len(resources)):
+            if not blocked[index]:
+                start(index)
+
+        while deadlines:
+            expiring = min(deadlines, key=deadlines.__getitem__)
+            try:
+                wait = None if timeout is None else max(0.0, deadlines[expiring] - monotonic())
+                index, error = finished.get(timeout=wait)
+            except Empty:
+                index, error = expiring, _make_timeout_error(resources[expiring][0], timeout)
+
+            if deadlines.pop(index, None) is None:
+                continue
+            if error is not None:
+                errors.append(error)
+
+            for dependent in unblocks[index]:
+                blocked[dependent] -= 1
+                if not blocked[dependent]:
+                    start(dependent)
+
+        self._finish_close(resources, errors)
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        resources, self._resources = self._resources, []
+        blockers = self._make_shutdown_blockers(resources)
+        tasks = []
+
+        async def close(index: int) -> None:
+            await asyncio.gather(*(tasks[blocker] for blocker in blockers[index]), return_exceptions=True)
+
+            provider, resource = resources[index]
+            try:
+                await asyncio.wait_for(aclose_resource(provider, resource), timeout)
+            except asyncio.TimeoutError:
+                raise _make_timeout_error(provider, timeout) from None
+
+        tasks.extend(asyncio.ensure_future(close(index)) for index in range(len(resources)))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._finish_close(resources, [result for result in results if isinstance(result, BaseException)])
+
+    def stats(self) -> dict[str, Any]:
+        counters = self.counters.as_dict() if self.counters is not None else {}
+        footprint = {
+            module.name: module.sizeof() + sum(provider.sizeof() for provider in self._iter_providers([module]))
+            for module in list(self._modules.values())
+        }
+
+        return {
+            **counters,
+            'modules': len(footprint),
+            'wrappers': len(footprint) + sum(1 for _ in self._iter_providers(list(self._modules.values()))),
+            'footprint': footprint,
+        }
+
+    @staticmethod
+    def scope(name: str = 'request') -> Scope:
+        return Scope(name)
+
+    def _warm(self) -> None:
+        resolve_tree_metadata = ResolveTreeMetadata(stats=self.counters)
+
+        for provider in self._iter_providers(list(self._modules.values()), scoped=False):
+            provider.resolve(resolve_tree_metadata)
+
+    def _warm_in_background(self) -> Future:
+        future = Future()
+
+        def warm() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                self._warm()
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(None)
+
+        threading.Thread(target=warm, name='pid-warm', daemon=True).start()
+
+        return future
+
+    async def _awarm(self, resolve_tree_metadata: ResolveTreeMetadata) -> None:
+        await asyncio.gather(*(
+            provider.aresolve(resolve_tree_metadata)
+            for provider in self._iter_providers(list(self._modules.values()), scoped=False)
+        ))
+
+    @staticmethod
+    def _iter_providers(modules: list[IModule], scoped: bool = True) -> Iterator[IProvider]:
+        visited = set()
+        pending = [provider for module in modules for provider in module.providers]
+
+        while pending:
+            provider = pending.pop()
+            if provider in visited or not scoped and provider.scope is not None:
+                continue
+
+            visited.add(provider)
+            pending.extend(provider.providers)
+
+            yield provider
+
+    def _make_override_provider(self, marker: Any, replacement: Any) -> IProvider:
+        if not isinstance(replacement, type):
+            return Provider.resolved(type(replacement), replacement)
+
+        provider = get_metadata(replacement).make_providable(self)
+        self._unbound_overrides.add(provider)
+
+        return provider
+
+    def _apply_override(self, marker: Any, provider: Optional[IProvider]) -> None:
+        if provider is None:
+            self.overrides.pop(marker, None)
+        else:
+            self.overrides[marker] = provider
+
+        invalidated = self._collect_dependents(marker)
+        errors = self._close_invalidated(set(invalidated))
+
+        for dependent in invalidated:
+            dependent.invalidate()
+            self._recorded.discard(dependent)
+
+        if errors:
+            raise ExceptionGroup('Errors while closing overridden providers', errors)
+
+    def _close_invalidated(self, invalidated: set[IProvider]) -> list[BaseException]:
+        closing, kept = [], []
+        for provider, resource in self._resources:
+            if provider in invalidated and not isasyncgen(resource):
+                closing.append((provider, resource))
+            else:
+                kept.append((provider, resource))
+
+        self._resources = kept
+        errors = []
+
+        for provider, resource in reversed(closing):
+            try:
+                close_resource(provider, resource)
+            except Exception as error:
+                errors.append(error)
+
+        return errors
+
+    def _collect_dependents(self, marker: Any) -> list[IProvider]:
+        collected = {}
+        pending = list(self._marker_dependents.get(marker, ()))
+
+        while pending:
+            dependent = pending.pop()
+            if dependent in collected:
+                continue
+
+            collected[dependent] = None
+            pending.extend(self._dependents.get(dependent, ()))
+
+        return list(collected)
+
+    def _make_shutdown_blockers(self, resources: list[tuple[IProvider, Any]]) -> list[list[int]]:
+        indexes: dict[IProvider, list[int]] = {}
+        for index, (provider, _) in enumerate(resources):
+            indexes.setdefault(provider, []).append(index)
+
+        blockers = []
+
+        for provider, _ in resources:
+            reachable = set()
+            pending = list(self._dependents.get(provider, ()))
+
+            while pending:
+                dependent = pending.pop()
+                if dependent in reachable or dependent is provider:
+                    continue
+
+                reachable.add(dependent)
+                pending.extend(self._dependents.get(dependent, ()))
+
+            blockers.append([index for dependent in reachable for index in indexes.get(dependent, ())])
+
+        return blockers
+
+    @staticmethod
+    def _finish_close(resources: list[tuple[IProvider, Any]], errors: list[BaseException]) -> None:
+        for provider, _ in resources:
+            provider.invalidate()
+
+        if errors:
+            raise ExceptionGroup('Errors while closing providers', errors)
+
+    def _after_fork(self) -> None:
+        modules = list(self._modules.values())
+        rebuild = []
+
+        for provider in (*modules, *self._iter_providers(modules)):
+            provider.reset_after_fork()
+
+            if provider.after_fork == 'reinit' and provider.scope is None:
+                rebuild.append(provider)
+
+        for provider in rebuild:
+            provider.resolve(ResolveTreeMetadata(stats=self.counters))
+
+    def _make_providable(self, class_: Type[Any]) -> IProvider:
+        metadata = get_metadata(class_)
+
+        if self._cache is not None and metadata.class_ not in self._cached:
+            self._cache.load_or_save(metadata.class_)
+            self._cached.add(metadata.class_)
+
+        return metadata.make_providable(self)
+
+
+def _make_timeout_error(provider: IProvider, timeout: Optional[float]) -> TimeoutError:
+    return TimeoutError(f'{provider.name} did not close within {timeout}s')
+
+
+class Override:
+    def __init__(self, container: Container, marker: Any, previous: Optional[IProvider]):
+        self._container = container
+        self._marker = marker
+        self._previous = previous
+
+    def restore(self) -> None:
+        self._container._apply_override(self._marker, self._previous)
+
+    def __enter__(self) -> Override:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.restore()
+
+
+def _after_fork_in_child() -> None:
+    for container in list(_containers):
+        container._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -2,6 +2,7 @@ from typing import Type, Optional, Callable, Any
 
 from ..bootstrap.const import METADATA_ATTRIBUTE
 from ..bootstrap.metadata import MetaData
+from ..shared import AfterFork, PoolSpec
 
 
 class Pid:
@@ -33,8 +34,14 @@ class Pid:
     def injectable[T](
             *,
             providers: Optional[Any] = None,
-            factory: Optional[Callable[[Any], T]] = None
+            factory: Optional[Callable[[Any], T]] = None,
+            scope: Optional[str] = None,
+            pool: Optional[PoolSpec] = None,
+            after_fork: AfterFork = 'keep',
     ) -> Callable:
+        if pool is not None:
+            pool.check()
+
         def wrapper(class_: Type[T]) -> Type[T]:
             setattr(
                 class_,
@@ -46,6 +53,9 @@ class Pid:
                     exports=[],
                     providers=providers or [],
                     factory=factory,
+                    scope=scope,
+                    pool=pool,
+                    after_fork=after_fork,
                 )
             )
 
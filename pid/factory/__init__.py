@@ -0,0 +1 @@
+from .factory import Factory, bind_factory, check_transient_factory
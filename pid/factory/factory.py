@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from functools import partial
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from typing import Any, Callable, Optional
+
+from ..shared import IProvider, UnsupportedFactory
+
+__all__ = [
+    'Factory',
+    'bind_factory',
+    'check_transient_factory',
+]
+
+
+def check_transient_factory(name: str, factory: Callable[..., Any]) -> None:
+    if isgeneratorfunction(factory) or isasyncgenfunction(factory) or iscoroutinefunction(factory):
+        raise UnsupportedFactory(f'{name} has a resource or async factory, it cannot be created on demand')
+
+
+def bind_factory(
+        factory: Callable[..., Any],
+        dependencies: dict[str, Any],
+        scoped: Optional[dict[str, IProvider]] = None,
+) -> Callable[..., Any]:
+    if not scoped:
+        return partial(factory, **dependencies)
+
+    return partial(_create_scoped, factory, dependencies, scoped)
+
+
+def _create_scoped(
+        factory: Callable[..., Any],
+        dependencies: dict[str, Any],
+        scoped: dict[str, IProvider],
+        /,
+        **overrides: Any,
+) -> Any:
+    return factory(**{
+        **dependencies,
+        **{key: provider.resolve() for key, provider in scoped.items()},
+        **overrides,
+    })
+
+
+class Factory[T]:
+    __slots__ = ('_pid_provider', '_pid_create')
+
+    def __init__(self, provider: Optional[IProvider[T]]):
+        self._pid_provider = provider
+        self._pid_create: Optional[Callable[..., T]] = None
+
+    @classmethod
+    def bound(cls, factory: Callable[..., T], scoped: frozenset[str], /, **dependencies: Any) -> Factory[T]:
+        instance = cls(None)
+        instance._pid_create = bind_factory(
+            factory,
+            {key: value for key, value in dependencies.items() if key not in scoped},
+            {key: value for key, value in dependencies.items() if key in scoped},
+        )
+        return instance
+
+    def create(self, **overrides: Any) -> T:
+        return (self._pid_create or self._pid_bind())(**overrides)
+
+    def create_many(self, count: int) -> list[T]:
+        create = self._pid_create or self._pid_bind()
+        return [create() for _ in range(count)]
+
+    def _pid_bind(self) -> Callable[..., T]:
+        self._pid_create = self._pid_provider.make_factory()
+        return self._pid_create
+
+    def __repr__(self) -> str:
+        if self._pid_provider is None:
+            create = self._pid_create
+            return f'Factory({create.args[0] if create.func is _create_scoped else create.func!r})'
+
+        return f'Factory({self._pid_provider.name})'
@@ -0,0 +1 @@
+from .lazy import Lazy, unwrap
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..shared import IProvider
+
+__all__ = [
+    'Lazy',
+    'unwrap',
+]
+
+_NOT_RESOLVED = object()
+
+
+class Lazy[T]:
+    __slots__ = ('_pid_provider', '_pid_instance')
+
+    def __init__(self, provider: IProvider[T]):
+        object.__setattr__(self, '_pid_provider', provider)
+        object.__setattr__(self, '_pid_instance', _NOT_RESOLVED)
+
+    def _pid_resolve(self) -> T:
+        instance = object.__getattribute__(self, '_pid_instance')
+
+        if instance is _NOT_RESOLVED:
+            instance = object.__getattribute__(self, '_pid_provider').resolve()
+            object.__setattr__(self, '_pid_instance', instance)
+
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pid_resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._pid_resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._pid_resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._pid_resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        instance = object.__getattribute__(self, '_pid_instance')
+
+        if instance is _NOT_RESOLVED:
+            return f'Lazy({object.__getattribute__(self, "_pid_provider").name})'
+
+        return repr(instance)
+
+    def __str__(self) -> str:
+        return str(self._pid_resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self._pid_resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._pid_resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self._pid_resolve())
+
+    def __len__(self) -> int:
+        return len(self._pid_resolve())
+
+    def __iter__(self) -> Any:
+        return iter(self._pid_resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._pid_resolve()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._pid_resolve()[key]
+
+
+def unwrap[T](lazy: Lazy[T] | T) -> T:
+    if isinstance(lazy, Lazy):
+        return lazy._pid_resolve()
+
+    return lazy
@@ -0,0 +1 @@
+from .manifest import Manifest
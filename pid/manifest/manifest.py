@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Type, Optional
+
+from ..bootstrap.utils import get_metadata, make_reference
+from ..pools import ProvidersPool
+
+
+class Manifest:
+    def __init__(self, providers: Optional[dict[str, tuple[str, ...]]] = None):
+        self._providers = providers or {}
+
+    def get(self, reference: str) -> Optional[tuple[str, ...]]:
+        return self._providers.get(reference)
+
+    @property
+    def providers(self) -> dict[str, tuple[str, ...]]:
+        return self._providers
+
+    @classmethod
+    def build(cls, root: Type[Any] | str) -> Manifest:
+        providers = {}
+        visited = set()
+        pending = [get_metadata(root)]
+
+        while pending:
+            metadata = pending.pop()
+            if metadata.class_ in visited:
+                continue
+
+            visited.add(metadata.class_)
+
+            if not metadata.is_module:
+                providers[make_reference(metadata.class_)] = tuple(
+                    ProvidersPool.make_alias_key(alias) for alias in metadata.aliases
+                )
+
+            for unit in (*(metadata.imports or ()), *(metadata.providers or ())):
+                pending.append(get_metadata(unit))
+
+        return cls(providers)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> Manifest:
+        with open(path) as file:
+            return cls({reference: tuple(alias_keys) for reference, alias_keys in json.load(file).items()})
+
+    def save(self, path: str | os.PathLike) -> None:
+        with open(path, 'w') as file:
+            json.dump({reference: list(alias_keys) for reference, alias_keys in self._providers.items()}, file, indent=2)
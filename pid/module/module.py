@@ -1,71 +1,101 @@
 from __future__ import annotations
 
-from copy import copy
+import asyncio
+from functools import partial
 from typing import Type, Optional, Any, Callable
 
 from ..abstract import AbstractProvider
 from ..bootstrap.utils import get_metadata
 from ..pools import ProvidersPool
 from ..shared import (
-    IProvider, IModule,
+    IProvider, IModule, IPlanCompiler, IContainer,
     UndefinedExport, IMetaData,
-    ResolveTreeMetadata,
+    ResolveTreeMetadata, ResolutionLock, sizeof,
 )
 
 
 class PidModule[T](AbstractProvider[T]):
-    is_module = True
-
-    __instances__ = {}
-
-    def __new__(
-            cls,
-            class_: Type[T],
-            imports: Optional[list[Any]] = None,
-            exports: Optional[list[Any]] = None,
-            providers: Optional[list[Any]] = None,
-    ):
-        return cls._get_or_create_instance(class_)
+    __slots__ = (
+        '_imports',
+        '_exports',
+        '_references',
+        '_loaded_references',
+        '_resolved_module',
+        '_exports_cache',
+    )
 
-    @classmethod
-    def _get_or_create_instance(cls, class_: Type[T]) -> 'PidModule':
-        instance = cls.__instances__.get(class_.__name__)
-        if instance is None:
-            cls.__instances__[class_.__name__] = super().__new__(cls)
-        return cls.__instances__.get(class_.__name__)
+    is_module = True
 
     def __init__(
             self,
             class_: Type[T],
+            container: IContainer,
             imports: Optional[list[Any]] = None,
             exports: Optional[list[Any]] = None,
             providers: Optional[list[Any]] = None,
     ) -> None:
         self.class_ = class_
+        self._container = container
+        self._references: dict[str, tuple[str, ...]] = {}
+        self._loaded_references: dict[str, IProvider] = {}
         self._imports = self._initialize_imports(imports)
         self._exports = self._initialize_exports(exports)
         self._providers = self._initialize_providers(providers)
         self._initialize_pools()
 
     def _initialize_imports(self, imports: Optional[list[Any]]) -> list[IModule]:
-        return [get_metadata(import_).make_providable() for import_ in imports] if imports else []
+        return [
+            get_metadata(import_).make_providable(self._container) for import_ in imports
+        ] if imports else []
 
     def _initialize_exports(self, exports: Optional[list[Any]]) -> list[IMetaData]:
         return [get_metadata(export_) for export_ in exports] if exports else []
 
     def _initialize_providers(self, providers: Optional[list[Any]]) -> list[IProvider]:
-        return [get_metadata(provider_).make_providable() for provider_ in providers] if providers else []
+        initialized_providers = []
+
+        for provider_ in providers or []:
+            alias_keys = self._get_reference_alias_keys(provider_)
+
+            if alias_keys is not None:
+                self._references[provider_] = alias_keys
+            else:
+                initialized_providers.append(get_metadata(provider_).make_providable(self._container))
+
+        return initialized_providers
+
+    def _get_reference_alias_keys(self, provider_: Any) -> Optional[tuple[str, ...]]:
+        if not isinstance(provider_, str) or self._container.manifest is None:
+            return None
+
+        return self._container.manifest.get(provider_)
+
+    def _load_reference(self, reference: str) -> IProvider:
+        provider = self._loaded_references.get(reference)
+
+        if provider is None:
+            provider = get_metadata(reference).make_providable(self._container)
+            provider.set_providers_pool(self._make_child_providers_pool())
+
+            self._loaded_references[reference] = provider
+            self._providers.append(provider)
+            del self._references[reference]
+
+        return provider
 
     def _initialize_pools(self) -> None:
         self._resolved_module = None
-        self._own_providers_pool = ProvidersPool()
-        self._inherit_providers_pool = ProvidersPool()
+        self._resolving: Optional[asyncio.Future[T]] = None
+        self._lock = ResolutionLock(self.class_.__name__)
+        self._own_providers_pool = ProvidersPool(stats=self._container.counters)
+        self._inherit_providers_pool = ProvidersPool(stats=self._container.counters)
+        self._exports_cache: Optional[tuple[ProvidersPool, int, ProvidersPool]] = None
 
     def resolve(
             self,
             resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> T:
-        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata([])
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata()
 
         return self._resolve(resolve_tree_metadata)
 
@@ -73,23 +103,99 @@ class PidModule[T](AbstractProvider[T]):
             self,
             resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> T:
-        resolve_tree_metadata.chain.append(self.class_.__name__)
-
-        if self._resolved_module:
+        if self._resolved_module is not None:
+            self._profile_hit(resolve_tree_metadata)
             return self._resolved_module
 
-        self._resolve_imports(resolve_tree_metadata)
-        self._update_provider_pools()
-        resolved_module = self._provide(resolve_tree_metadata)
-        self._resolved_module = resolved_module
+        if self._lock.is_owned():
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        with self._lock:
+            if self._resolved_module is not None:
+                self._profile_hit(resolve_tree_metadata)
+                return self._resolved_module
+
+            resolve_tree_metadata = resolve_tree_metadata.extend(self)
+
+            with self._profile(resolve_tree_metadata):
+                self._resolve_imports(resolve_tree_metadata)
+                self._update_provider_pools()
+                resolved_module = self._provide(resolve_tree_metadata)
+
+            self._resolved_module = resolved_module
 
-        return self._resolved_module
+            return self._resolved_module
 
     def _resolve_imports(self, resolve_tree_metadata: ResolveTreeMetadata) -> None:
         for module in self._imports:
-            module.resolve(copy(resolve_tree_metadata))
-            export_pool = ProvidersPool.from_providers(module.make_exports())
-            self._inherit_providers_pool.merge(export_pool)
+            module.resolve(resolve_tree_metadata)
+            self._inherit_exports(module)
+
+    async def aresolve(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> T:
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata(waits={})
+
+        return await self._aresolve(resolve_tree_metadata)
+
+    async def _aresolve(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> T:
+        if self._resolved_module is not None:
+            self._profile_hit(resolve_tree_metadata)
+            return self._resolved_module
+
+        if self._resolving is None:
+            self._resolving = asyncio.ensure_future(self._aresolve_module(resolve_tree_metadata.extend(self)))
+        elif resolve_tree_metadata.find_cycle(self) is not None:
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        return await self._await_resolving(self._resolving, resolve_tree_metadata)
+
+    async def _aresolve_module(self, resolve_tree_metadata: ResolveTreeMetadata) -> T:
+        try:
+            await self._aresolve_imports(resolve_tree_metadata)
+            self._update_provider_pools()
+            resolved_module = await self._aprovide(resolve_tree_metadata)
+            self._resolved_module = resolved_module
+            return self._resolved_module
+        finally:
+            self._resolving = None
+
+    async def _aresolve_imports(self, resolve_tree_metadata: ResolveTreeMetadata) -> None:
+        await asyncio.gather(*(module.aresolve(resolve_tree_metadata) for module in self._imports))
+
+        for module in self._imports:
+            self._inherit_exports(module)
+
+    def _compile(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> int:
+        slot = compiler.get_slot(self)
+        if slot is not None:
+            return slot
+
+        if compiler.is_compiling(self):
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        resolve_tree_metadata = resolve_tree_metadata.extend(self)
+        compiler.start(self)
+
+        self._compile_imports(compiler, resolve_tree_metadata)
+        self._update_provider_pools()
+        return self._compile_step(compiler, resolve_tree_metadata)
+
+    def _compile_imports(self, compiler: IPlanCompiler, resolve_tree_metadata: ResolveTreeMetadata) -> None:
+        for module in self._imports:
+            module.compile(compiler, resolve_tree_metadata)
+            self._inherit_exports(module)
+
+    def _inherit_exports(self, module: IModule) -> None:
+        self._inherit_providers_pool.merge(module.make_export_providers_pool())
 
     def _update_provider_pools(self) -> None:
         self._own_providers_pool = self._make_own_providers_pool()
@@ -98,8 +204,27 @@ class PidModule[T](AbstractProvider[T]):
             provider.set_providers_pool(child_providers_pool)
 
     def make_exports(self) -> list[IProvider]:
+        return list(self.make_export_providers_pool().get_all().values())
+
+    def make_export_providers_pool(self) -> ProvidersPool:
         child_providers_pool = self._make_child_providers_pool()
+        version = child_providers_pool.version
+
+        if self._exports_cache is not None:
+            cached_pool, cached_version, export_pool = self._exports_cache
+
+            if cached_pool is child_providers_pool and cached_version == version:
+                return export_pool
+
+        export_pool = ProvidersPool.from_providers(
+            self._collect_exports(child_providers_pool),
+            stats=child_providers_pool.stats,
+        )
+        self._exports_cache = (child_providers_pool, version, export_pool)
 
+        return export_pool
+
+    def _collect_exports(self, child_providers_pool: ProvidersPool) -> list[IProvider]:
         export_units_metadata_for_export = []
 
         for export_unit_metadata in self._exports:
@@ -109,27 +234,37 @@ class PidModule[T](AbstractProvider[T]):
             else:
                 export_units_metadata_for_export.append(export_unit_metadata)
 
-        undefined_exports = [
-            metadata
-            for metadata in export_units_metadata_for_export
-            if not child_providers_pool.has(metadata.class_)
-        ]
+        exports = [child_providers_pool.find(metadata.class_) for metadata in export_units_metadata_for_export]
 
-        if undefined_exports:
+        if None in exports:
             raise UndefinedExport()
 
-        return [child_providers_pool.get(metadata.class_) for metadata in export_units_metadata_for_export]
+        return exports
+
+    def invalidate(self) -> None:
+        self._resolved_module = None
+
+    def sizeof(self) -> int:
+        size = super().sizeof() + self._inherit_providers_pool.sizeof()
+
+        if self._resolved_module is not None:
+            size += sizeof(self._resolved_module)
+
+        return size
 
     def _make_own_providers_pool(self) -> ProvidersPool:
-        pool = ProvidersPool()
+        if not self._providers and not self._references:
+            return self._inherit_providers_pool
 
-        for provider in self._providers:
-            pool.add(provider)
+        pool = ProvidersPool.from_providers(self._providers, parent=self._inherit_providers_pool)
+
+        for reference, alias_keys in list(self._references.items()):
+            pool.add_deferred(alias_keys, partial(self._load_reference, reference))
 
         return pool
 
     def _make_child_providers_pool(self) -> ProvidersPool:
-        return self._inherit_providers_pool.copy().merge(self._own_providers_pool)
+        return self._own_providers_pool
 
     @property
     def provider_method(self) -> Callable[[*Any], T]:
@@ -0,0 +1 @@
+from .plan import PlanStep, PlanCompiler, ResolutionPlan
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor
+from contextvars import Context, copy_context
+from functools import partial
+from inspect import isasyncgenfunction, isgeneratorfunction
+from typing import Any, Callable, NamedTuple, Optional, Type
+
+from ..factory import Factory, check_transient_factory
+from ..lazy import Lazy
+from ..pooled import Pooled
+from ..provider import Provider
+from ..scope import Scope
+from ..shared import IProvider, IPlanCompiler, DependencyKind, ScopeIsNotActive, UnsupportedFactory
+
+
+_NOT_BUILT = object()
+
+type MakeHandle = Callable[[Callable[[], Any]], Any]
+
+
+class PlanStep(NamedTuple):
+    class_: Type[Any]
+    factory: Callable[[*Any], Any]
+    arguments: tuple[tuple[str, int], ...]
+    handles: tuple[tuple[str, int, MakeHandle, bool], ...]
+
+
+class ResolutionPlan[T]:
+    def __init__(self, steps: list[PlanStep]):
+        self._steps = tuple(steps)
+        self._eager = self._make_eager()
+        self._levels: Optional[tuple[tuple[int, ...], ...]] = None
+
+    @property
+    def steps(self) -> tuple[PlanStep, ...]:
+        return self._steps
+
+    @property
+    def levels(self) -> tuple[tuple[int, ...], ...]:
+        if self._levels is None:
+            self._levels = self._make_levels()
+
+        return self._levels
+
+    def run(self, executor: Optional[Executor] = None) -> T:
+        run = _PlanRun(self._steps)
+
+        if executor is not None:
+            build = partial(_run_in_context, copy_context(), run.build)
+
+            for level in self.levels:
+                for slot, instance in zip(level, executor.map(build, level)):
+                    run.slots[slot] = instance
+        else:
+            slots = run.slots
+
+            for slot in self._eager:
+                _, factory, arguments, handles = self._steps[slot]
+                kwargs = {key: slots[argument_slot] for key, argument_slot in arguments}
+
+                for key, handle_slot, make_handle, _ in handles:
+                    kwargs[key] = make_handle(partial(run.get, handle_slot))
+
+                slots[slot] = factory(**kwargs)
+
+        return run.slots[-1]
+
+    def _make_eager(self) -> tuple[int, ...]:
+        eager = [True] * len(self._steps)
+
+        for _, _, arguments, handles in self._steps:
+            for _, dependency_slot, *_ in (*arguments, *handles):
+                eager[dependency_slot] = False
+
+        for slot in reversed(range(len(self._steps))):
+            if not eager[slot]:
+                continue
+
+            _, _, arguments, handles = self._steps[slot]
+
+            for _, dependency_slot in arguments:
+                eager[dependency_slot] = True
+
+            for _, dependency_slot, _, deferred in handles:
+                eager[dependency_slot] = eager[dependency_slot] or not deferred
+
+        return tuple(slot for slot, is_eager in enumerate(eager) if is_eager)
+
+    def _make_levels(self) -> tuple[tuple[int, ...], ...]:
+        depths = []
+        levels: list[list[int]] = []
+
+        for step in self._steps:
+            depths.append(max(
+                (depths[dependency_slot] + 1 for _, dependency_slot, *_ in (*step.arguments, *step.handles)),
+                default=0,
+            ))
+
+        for slot in self._eager:
+            while depths[slot] >= len(levels):
+                levels.append([])
+            levels[depths[slot]].append(slot)
+
+        return tuple(tuple(level) for level in levels if level)
+
+
+class _PlanRun:
+    __slots__ = ('slots', '_steps', '_lock')
+
+    def __init__(self, steps: tuple[PlanStep, ...]):
+        self.slots = [_NOT_BUILT] * len(steps)
+        self._steps = steps
+        self._lock: Optional[threading.RLock] = None
+
+    def get(self, slot: int) -> Any:
+        instance = self.slots[slot]
+
+        if instance is _NOT_BUILT:
+            self._lock = self._lock or threading.RLock()
+
+            with self._lock:
+                instance = self.slots[slot]
+
+                if instance is _NOT_BUILT:
+                    for _, argument_slot in self._steps[slot].arguments:
+                        self.get(argument_slot)
+
+                    instance = self.slots[slot] = self.build(slot)
+
+        return instance
+
+    def build(self, slot: int) -> Any:
+        _, factory, arguments, handles = self._steps[slot]
+        slots = self.slots
+
+        kwargs = {key: slots[argument_slot] for key, argument_slot in arguments}
+
+        for key, handle_slot, make_handle, _ in handles:
+            kwargs[key] = make_handle(partial(self.get, handle_slot))
+
+        return factory(**kwargs)
+
+
+class _DeferredSlot:
+    __slots__ = ('name', 'resolve')
+
+    def __init__(self, name: str, resolve: Callable[[], Any]):
+        self.name = name
+        self.resolve = resolve
+
+
+def _run_in_context(context: Context, build: Callable[[int], Any], slot: int) -> Any:
+    return context.copy().run(build, slot)
+
+
+def _build_scoped(provider: IProvider, factory: Callable[..., Any], /, **dependencies: Any) -> Any:
+    scope = Scope.current(provider.scope)
+
+    if scope is None:
+        raise ScopeIsNotActive(f'{provider.name} requires an active {provider.scope!r} scope')
+
+    instance = scope.get(provider)
+
+    if instance is None:
+        instance = factory(**dependencies)
+        scope.set(provider, instance)
+
+    return instance
+
+
+class PlanCompiler(IPlanCompiler):
+    def __init__(self):
+        self._slots: dict[tuple[IProvider, DependencyKind], int] = {}
+        self._steps: list[PlanStep] = []
+        self._providers: list[IProvider] = []
+        self._kinds: list[DependencyKind] = []
+        self._compiling: set[tuple[IProvider, DependencyKind]] = set()
+
+    def get_slot(self, provider: IProvider, kind: DependencyKind = DependencyKind.VALUE) -> Optional[int]:
+        return self._slots.get((provider, kind))
+
+    def is_compiling(self, provider: IProvider, kind: DependencyKind = DependencyKind.VALUE) -> bool:
+        return (provider, kind) in self._compiling
+
+    def start(self, provider: IProvider, kind: DependencyKind = DependencyKind.VALUE) -> None:
+        self._compiling.add((provider, kind))
+
+    def add_step(
+            self,
+            provider: IProvider,
+            arguments: dict[str, int],
+            handles: dict[str, tuple[int, DependencyKind]],
+            kind: DependencyKind = DependencyKind.VALUE,
+    ) -> int:
+        slot = len(self._steps)
+        scoped = frozenset()
+
+        if kind is DependencyKind.FACTORY or kind is DependencyKind.POOLED:
+            scoped_arguments = {
+                key: (argument_slot, DependencyKind.RAW)
+                for key, argument_slot in arguments.items()
+                if self._providers[argument_slot].scope is not None
+            }
+
+            if scoped_arguments:
+                scoped = frozenset(scoped_arguments)
+                arguments = {key: argument_slot for key, argument_slot in arguments.items() if key not in scoped}
+                handles = {**handles, **scoped_arguments}
+
+        self._steps.append(PlanStep(
+            class_=provider.class_,
+            factory=self._make_step_factory(provider, kind, scoped),
+            arguments=tuple(arguments.items()),
+            handles=tuple(
+                (key, handle_slot, *self._make_handle_factory(self._providers[handle_slot], handle_kind))
+                for key, (handle_slot, handle_kind) in handles.items()
+            ),
+        ))
+        self._providers.append(provider)
+        self._kinds.append(kind)
+        self._slots[provider, kind] = slot
+        self._compiling.discard((provider, kind))
+
+        return slot
+
+    @staticmethod
+    def _make_step_factory(
+            provider: IProvider,
+            kind: DependencyKind,
+            scoped: frozenset[str],
+    ) -> Callable[[*Any], Any]:
+        if kind is DependencyKind.FACTORY:
+            return partial(Factory.bound, provider.factory, scoped)
+        elif kind is DependencyKind.POOLED:
+            return partial(Pooled.bound, provider.pool_spec, provider.factory, scoped)
+        elif provider.scope is not None:
+            return partial(_build_scoped, provider, provider.factory)
+
+        return provider.factory
+
+    @staticmethod
+    def _make_handle_factory(provider: IProvider, kind: DependencyKind) -> tuple[MakeHandle, bool]:
+        if provider.scope is not None:
+            return (lambda _: provider if kind is DependencyKind.RAW else Lazy(provider)), True
+        elif kind is DependencyKind.LAZY:
+            return (lambda get: Lazy(_DeferredSlot(provider.name, get))), True
+
+        return (lambda get: Provider.resolved(provider.class_, get())), False
+
+    @staticmethod
+    def _check_factory(provider: IProvider, kind: DependencyKind) -> None:
+        if kind is DependencyKind.FACTORY or kind is DependencyKind.POOLED:
+            check_transient_factory(provider.name, provider.factory)
+        elif isgeneratorfunction(provider.factory) or isasyncgenfunction(provider.factory):
+            raise UnsupportedFactory(f'{provider.name} has a resource factory, compiled plans cannot close it')
+
+    def make_plan(self) -> ResolutionPlan:
+        for provider, kind in zip(self._providers, self._kinds):
+            self._check_factory(provider, kind)
+
+        return ResolutionPlan(self._steps)
+
+    def make_levels(self) -> tuple[tuple[IProvider, ...], ...]:
+        return tuple(
+            tuple(self._providers[slot] for slot in level if self._kinds[slot] is DependencyKind.VALUE)
+            for level in ResolutionPlan(self._steps).levels
+        )
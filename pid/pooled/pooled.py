@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from time import monotonic, perf_counter
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from ..factory import Factory
+from ..shared import PoolSpec, PoolExhausted
+
+__all__ = [
+    'Pooled',
+    'PoolStats',
+]
+
+_EMPTY = object()
+_CAPACITY = object()
+
+
+class PoolStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.evicted = 0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.evicted = 0
+
+
+class _ThreadWaiter:
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = _EMPTY
+
+    def deliver(self, value: Any) -> bool:
+        self.value = value
+        self.event.set()
+        return True
+
+
+class _AsyncWaiter:
+    def __init__(self, pool: Pooled):
+        self.pool = pool
+        self.loop = asyncio.get_running_loop()
+        self.future: asyncio.Future = self.loop.create_future()
+
+    def deliver(self, value: Any) -> bool:
+        try:
+            self.loop.call_soon_threadsafe(self._set_result, value)
+        except RuntimeError:
+            return False
+
+        return True
+
+    def _set_result(self, value: Any) -> None:
+        if self.future.done():
+            self.pool._release(value)
+        else:
+            self.future.set_result(value)
+
+
+class Pooled[T]:
+    def __init__(self, create: Callable[[], T], spec: PoolSpec = PoolSpec()):
+        spec.check()
+
+        self.spec = spec
+        self.stats = PoolStats()
+
+        self._create = create
+        self._idle: deque[tuple[T, float]] = deque()
+        self._waiters: deque[_ThreadWaiter | _AsyncWaiter] = deque()
+        self._size = 0
+        self._warmed = spec.min == 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def bound(
+            cls,
+            spec: PoolSpec,
+            factory: Callable[..., T],
+            scoped: frozenset[str],
+            /,
+            **dependencies: Any,
+    ) -> Pooled[T]:
+        return cls(Factory.bound(factory, scoped, **dependencies).create, spec)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[T]:
+        instance = self._get(timeout)
+        try:
+            yield instance
+        finally:
+            self._release(instance)
+
+    @asynccontextmanager
+    async def aacquire(self, timeout: Optional[float] = None) -> AsyncIterator[T]:
+        instance = await self._aget(timeout)
+        try:
+            yield instance
+        finally:
+            self._release(instance)
+
+    def _get(self, timeout: Optional[float]) -> T:
+        if not self._warmed:
+            self._warm()
+
+        with self._lock:
+            instance = self._take()
+            if instance is _EMPTY:
+                waiter = _ThreadWaiter()
+                self._waiters.append(waiter)
+                self.stats.waits += 1
+
+        if instance is _CAPACITY:
+            return self._make()
+        elif instance is not _EMPTY:
+            return instance
+
+        started = perf_counter()
+        waiter.event.wait(timeout)
+        self.stats.wait_time += perf_counter() - started
+
+        with self._lock:
+            if waiter.value is _EMPTY:
+                self._waiters.remove(waiter)
+                raise PoolExhausted(f'No instance became available within {timeout}s')
+
+        return self._make() if waiter.value is _CAPACITY else waiter.value
+
+    async def _aget(self, timeout: Optional[float]) -> T:
+        if not self._warmed:
+            self._warm()
+
+        with self._lock:
+            instance = self._take()
+            if instance is _EMPTY:
+                waiter = _AsyncWaiter(self)
+                self._waiters.append(waiter)
+                self.stats.waits += 1
+
+        if instance is _CAPACITY:
+            return self._make()
+        elif instance is not _EMPTY:
+            return instance
+
+        started = perf_counter()
+        try:
+            value = await asyncio.wait_for(waiter.future, timeout)
+        except BaseException as error:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+            if isinstance(error, asyncio.TimeoutError):
+                raise PoolExhausted(f'No instance became available within {timeout}s') from None
+            raise
+        finally:
+            self.stats.wait_time += perf_counter() - started
+
+        return self._make() if value is _CAPACITY else value
+
+    def _take(self) -> Any:
+        self._evict()
+
+        if self._idle:
+            self.stats.hits += 1
+            return self._idle.pop()[0]
+
+        if self._size < self.spec.max:
+            self._size += 1
+            self.stats.misses += 1
+            return _CAPACITY
+
+        return _EMPTY
+
+    def _evict(self) -> None:
+        if self.spec.idle_timeout is None:
+            return
+
+        expired = monotonic() - self.spec.idle_timeout
+
+        while self._idle and self._idle[0][1] < expired and self._size > self.spec.min:
+            self._idle.popleft()
+            self._size -= 1
+            self.stats.evicted += 1
+
+    def _make(self) -> T:
+        try:
+            return self._create()
+        except BaseException:
+            self._release(_CAPACITY)
+            raise
+
+    def _warm(self) -> None:
+        with self._lock:
+            if self._warmed:
+                return
+
+            self._warmed = True
+            missing = max(self.spec.min - self._size, 0)
+            self._size += missing
+
+        for _ in range(missing):
+            self._release(self._make())
+
+    def _release(self, value: Any) -> None:
+        with self._lock:
+            while self._waiters:
+                if self._waiters.popleft().deliver(value):
+                    return
+
+            if value is _CAPACITY:
+                self._size -= 1
+            else:
+                self._idle.append((value, monotonic()))
+
+    def __repr__(self) -> str:
+        return f'Pooled(size={self._size}, idle={len(self._idle)}, max={self.spec.max})'
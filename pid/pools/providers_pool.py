@@ -1,61 +1,210 @@
 from __future__ import annotations
 
-from typing import Any, Type, Optional
+import threading
+from typing import Any, Callable, Iterable, Type, Optional
 
-from ..shared import IProvider, merge_deep, MultipleProvidersForAlias
+from ..shared import IProvider, MultipleProvidersForAlias, ContainerStats, sizeof
+
+type Aliases = tuple[type, Any]
+type Loader = Callable[[], IProvider]
 
 
 class ProvidersPool:
-    def __init__(self):
-        self._providers: dict[tuple[type, Any], IProvider] = {}
+    __slots__ = (
+        '_parent',
+        '_stats',
+        '_providers',
+        '_index',
+        '_conflicts',
+        '_version',
+        '_deferred',
+        '_deferred_keys',
+        '_deferred_lock',
+    )
+
+    def __init__(self, parent: Optional[ProvidersPool] = None, stats: Optional[ContainerStats] = None):
+        self._parent = parent
+        self._stats = stats if stats is not None or parent is None else parent._stats
+        self._providers: dict[Aliases, IProvider] = {}
+        self._index: dict[Any, Aliases] = {}
+        self._conflicts: set[Any] = set()
+        self._version = 0
+        self._deferred: dict[str, list[Loader]] = {}
+        self._deferred_keys: dict[Loader, tuple[str, ...]] = {}
+        self._deferred_lock: Optional[threading.RLock] = None
+
+        if self._stats is not None:
+            self._stats.pools_created += 1
 
     def add(self, provider: IProvider) -> None:
-        aliases = self._get_class_aliases(provider.class_)
+        self._insert(provider.aliases, provider)
 
-        self._providers[aliases] = provider
+    def find(self, class_: Type[Any]) -> Optional[IProvider]:
+        if self._stats is not None:
+            self._stats.lookups += 1
+
+        provider = self._find(class_)
+
+        if provider is None and self._stats is not None:
+            self._stats.lookup_misses += 1
+
+        return provider
+
+    def _find(self, class_: Type[Any]) -> Optional[IProvider]:
+        pool = self
+
+        while pool is not None:
+            if class_ in pool._conflicts:
+                raise MultipleProvidersForAlias()
+
+            aliases = pool._index.get(class_)
+            if aliases is not None:
+                return pool._providers[aliases]
+
+            if pool._deferred and pool._load_deferred(self.make_alias_key(class_)):
+                continue
+
+            pool = pool._parent
+
+        return None
 
     def get(self, class_: Type[Any]) -> Any:
-        result: Optional[IProvider] = None
+        return self.find(class_)
+
+    def add_deferred(self, alias_keys: Iterable[str], loader: Loader) -> None:
+        alias_keys = tuple(alias_keys)
+        self._deferred_lock = self._deferred_lock or threading.RLock()
+        self._deferred_keys[loader] = alias_keys
+
+        for alias_key in alias_keys:
+            self._deferred.setdefault(alias_key, []).append(loader)
+
+        if not self._index_keys().isdisjoint(alias_keys):
+            self._load_deferred_loader(loader)
 
-        for aliases_record, provider in self._providers.items():
-            aliases_record_set = set(aliases_record)
+    def get_all(self) -> dict[Aliases, IProvider]:
+        providers = {}
 
-            if {class_}.intersection(aliases_record_set):
-                if result is None:
-                    result = provider
-                else:
-                    raise MultipleProvidersForAlias()
+        for layer in self._layers():
+            while layer._deferred_keys:
+                layer._load_deferred_loader(next(iter(layer._deferred_keys)))
 
-        return result
+            providers.update(layer._providers)
 
-    def get_all(self) -> dict[tuple[type, Any], IProvider]:
-        return self._providers
+        return providers
 
     def has(self, class_: Type[Any]) -> bool:
-        return bool(self.get(class_))
+        return self.find(class_) is not None
 
     def merge(self, pool: ProvidersPool) -> ProvidersPool:
-        self._set(merge_deep(self._providers, pool._providers))
+        for layer in pool._layers():
+            for aliases, provider in layer._providers.items():
+                self._insert(aliases, provider)
+
+            for loader, alias_keys in layer._deferred_keys.items():
+                self.add_deferred(alias_keys, loader)
+
+        if self._stats is not None:
+            self._stats.pools_merged += 1
 
         return self
 
     def copy(self) -> ProvidersPool:
-        new_pool = ProvidersPool()
-        new_pool._set(self._providers)
+        new_pool = ProvidersPool(parent=self._parent, stats=self._stats)
+        new_pool._providers = self._providers.copy()
+        new_pool._index = self._index.copy()
+        new_pool._conflicts = self._conflicts.copy()
+        new_pool._version = self._version
+        new_pool._deferred = {key: loaders.copy() for key, loaders in self._deferred.items()}
+        new_pool._deferred_keys = self._deferred_keys.copy()
 
         return new_pool
 
+    @property
+    def stats(self) -> Optional[ContainerStats]:
+        return self._stats
+
+    def sizeof(self) -> int:
+        return sizeof(self) + sizeof(self._providers) + sizeof(self._index)
+
+    @property
+    def version(self) -> int:
+        return sum(layer._version for layer in self._layers())
+
     @classmethod
-    def from_providers(cls, providers: list[IProvider]) -> ProvidersPool:
-        new_pool = ProvidersPool()
+    def from_providers(
+            cls,
+            providers: list[IProvider],
+            parent: Optional[ProvidersPool] = None,
+            stats: Optional[ContainerStats] = None,
+    ) -> ProvidersPool:
+        new_pool = ProvidersPool(parent=parent, stats=stats)
         for provider in providers:
             new_pool.add(provider)
         return new_pool
 
     @staticmethod
-    def _get_class_aliases(class_: Type[Any]) -> tuple[type, Any]:
-        return (class_, *(class_.__orig_bases__ if hasattr(class_, '__orig_bases__') else class_.__bases__))
+    def make_alias_key(alias: Any) -> str:
+        if isinstance(alias, type):
+            return f'{alias.__module__}:{alias.__qualname__}'
+
+        return repr(alias)
+
+    def _layers(self) -> list[ProvidersPool]:
+        layers = []
+        pool = self
+
+        while pool is not None:
+            layers.append(pool)
+            pool = pool._parent
+
+        return layers[::-1]
+
+    def _index_keys(self) -> set[str]:
+        return {self.make_alias_key(alias) for alias in self._index}
+
+    def _load_deferred(self, alias_key: str) -> bool:
+        with self._deferred_lock:
+            loaders = self._deferred.get(alias_key)
+            if not loaders:
+                return False
+
+            for loader in loaders.copy():
+                self._load_deferred_loader(loader)
+
+            return True
+
+    def _load_deferred_loader(self, loader: Loader) -> None:
+        alias_keys = self._deferred_keys.pop(loader, None)
+        if alias_keys is None:
+            return
+
+        for alias_key in alias_keys:
+            loaders = self._deferred[alias_key]
+            loaders.remove(loader)
+            if not loaders:
+                del self._deferred[alias_key]
+
+        self.add(loader())
+
+    def _insert(self, aliases: Aliases, provider: IProvider) -> None:
+        if self._deferred:
+            for alias in aliases:
+                self._load_deferred(self.make_alias_key(alias))
+
+        self._providers[aliases] = provider
+        self._version += 1
+
+        for alias in aliases:
+            owner = self._index.setdefault(alias, aliases)
+
+            if owner != aliases or self._parent is not None and self._parent._binds(alias, aliases):
+                self._conflicts.add(alias)
+
+    def _binds(self, alias: Any, aliases: Aliases) -> bool:
+        try:
+            provider = self._find(alias)
+        except MultipleProvidersForAlias:
+            return True
 
-    def _set(self, dependencies: dict[tuple[type, Any], IProvider]) -> None:
-        self._providers.clear()
-        self._providers.update(dependencies)
+        return provider is not None and provider.aliases != aliases
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Iterator, Optional
+
+from ..shared import IProvider, IProfiler
+
+
+class ProfileNode:
+    def __init__(
+            self,
+            name: str,
+            kind: str,
+            chain: tuple[str, ...],
+            parent: Optional[ProfileNode],
+            start: float,
+    ):
+        self.name = name
+        self.kind = kind
+        self.chain = chain
+        self.parent = parent
+        self.children: list[ProfileNode] = []
+
+        self.start = start
+        self.end = start
+        self.factory_time = 0.0
+        self.lookup_time = 0.0
+
+    @property
+    def total_time(self) -> float:
+        return self.end - self.start
+
+    @property
+    def dependencies_time(self) -> float:
+        return sum(child.total_time for child in self.children)
+
+    @property
+    def self_time(self) -> float:
+        return self.total_time - self.dependencies_time
+
+
+class Profiler(IProfiler):
+    def __init__(self):
+        self.nodes: list[ProfileNode] = []
+        self.hits: Counter[str] = Counter()
+
+        self._stack: list[ProfileNode] = []
+        self._origin = perf_counter()
+
+    @property
+    def roots(self) -> list[ProfileNode]:
+        return [node for node in self.nodes if node.parent is None]
+
+    @contextmanager
+    def measure(self, provider: IProvider, chain: list[Any]) -> Iterator[ProfileNode]:
+        parent = self._stack[-1] if self._stack else None
+        node = ProfileNode(
+            name=provider.name,
+            kind='module' if provider.is_module else 'provider',
+            chain=tuple(chain),
+            parent=parent,
+            start=perf_counter(),
+        )
+
+        if parent is not None:
+            parent.children.append(node)
+
+        self.nodes.append(node)
+        self._stack.append(node)
+        try:
+            yield node
+        finally:
+            node.end = perf_counter()
+            self._stack.pop()
+
+    @contextmanager
+    def measure_factory(self) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            if self._stack:
+                self._stack[-1].factory_time += perf_counter() - started
+
+    def add_lookup_time(self, duration: float) -> None:
+        if self._stack:
+            self._stack[-1].lookup_time += duration
+
+    def hit(self, provider: IProvider) -> None:
+        self.hits[provider.name] += 1
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        tid = threading.get_ident()
+
+        return {
+            'traceEvents': [
+                {
+                    'name': node.name,
+                    'cat': node.kind,
+                    'ph': 'X',
+                    'ts': (node.start - self._origin) * 1e6,
+                    'dur': node.total_time * 1e6,
+                    'pid': pid,
+                    'tid': tid,
+                    'args': {
+                        'factory_ms': node.factory_time * 1e3,
+                        'lookup_ms': node.lookup_time * 1e3,
+                        'dependencies_ms': node.dependencies_time * 1e3,
+                        'cache_hits': self.hits[node.name],
+                        'chain': ' <- '.join(reversed(node.chain)),
+                    },
+                }
+                for node in self.nodes
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def report(self, limit: Optional[int] = None) -> str:
+        nodes = sorted(self.nodes, key=lambda node: node.self_time, reverse=True)[:limit]
+
+        lines = [
+            f'{"self ms":>10} {"total ms":>10} {"factory ms":>11} {"lookup ms":>10} {"hits":>6}  name',
+        ]
+        lines.extend(
+            f'{node.self_time * 1e3:>10.3f} {node.total_time * 1e3:>10.3f} '
+            f'{node.factory_time * 1e3:>11.3f} {node.lookup_time * 1e3:>10.3f} '
+            f'{self.hits[node.name]:>6}  {node.name}'
+            for node in nodes
+        )
+
+        return '\n'.join(lines)
@@ -1,35 +1,71 @@
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from typing import Type, Optional, Callable, Any
 
 from ..abstract import AbstractProvider
 from ..bootstrap.utils import get_metadata
+from ..factory import Factory, bind_factory, check_transient_factory
+from ..pooled import Pooled
 from ..pools import ProvidersPool
-from ..shared import IProvider, ResolveTreeMetadata
+from ..scope import Scope
+from ..shared import (
+    IProvider, IPlanCompiler, IContainer,
+    AfterFork, Dependency, DependencyKind, PoolSpec, ResolveTreeMetadata, ResolutionLock, ScopeIsNotActive,
+    sizeof,
+)
+
+
+_EMPTY_POOL = ProvidersPool()
 
 
 class Provider[T](AbstractProvider[T]):
+    __slots__ = (
+        '_factory',
+        '_scope',
+        '_pool_spec',
+        '_pool',
+        '_resolved_provider',
+        'after_fork',
+    )
+
     is_module = False
 
     def __init__(
             self,
             class_: Type[T],
             providers: Optional[list[Type[T]]] = None,
-            factory: Optional[Callable[[*Type[Provider]], T]] = None
+            factory: Optional[Callable[[*Type[Provider]], T]] = None,
+            scope: Optional[str] = None,
+            pool: Optional[PoolSpec] = None,
+            after_fork: AfterFork = 'keep',
+            container: Optional[IContainer] = None,
     ):
         super().__init__()
 
         self.class_ = class_
 
+        self._container = container
         self._providers: list[IProvider] = [
-            get_metadata(provider_).make_providable() for provider_ in providers
+            get_metadata(provider_).make_providable(container) for provider_ in providers
         ] if providers else []
 
         self._factory = factory
+        self._scope = scope
+        self._pool_spec = pool
+        self._pool: Optional[Pooled[T]] = None
+        self.after_fork = after_fork
 
         self._resolved_provider: Optional[T] = None
-        self._own_providers_pool = ProvidersPool()
-        self._inherit_providers_pool = ProvidersPool()
+        self._resolving: Optional[asyncio.Future[T]] = None
+        self._lock = ResolutionLock(class_.__name__)
+        self._own_providers_pool = _EMPTY_POOL
+        self._inherit_providers_pool = _EMPTY_POOL
+
+    @classmethod
+    def resolved(cls, class_: Type[T], instance: T) -> Provider[T]:
+        return ResolvedProvider(class_, instance)
 
     def set_providers_pool(self, pool: ProvidersPool) -> None:
         self._inherit_providers_pool = pool
@@ -38,7 +74,7 @@ class Provider[T](AbstractProvider[T]):
             self,
             resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> T:
-        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata([])
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata()
 
         return super().resolve(resolve_tree_metadata)
 
@@ -46,15 +82,213 @@ class Provider[T](AbstractProvider[T]):
             self,
             resolve_tree_metadata: ResolveTreeMetadata = None,
     ) -> T:
-        resolve_tree_metadata.chain.append(self.class_.__name__)
+        if self._scope is not None:
+            return self._resolve_scoped(resolve_tree_metadata)
+
+        if self._resolved_provider is not None:
+            self._profile_hit(resolve_tree_metadata)
+            return self._resolved_provider
+
+        if self._lock.is_owned():
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        with self._lock:
+            if self._resolved_provider is not None:
+                self._profile_hit(resolve_tree_metadata)
+                return self._resolved_provider
+
+            resolve_tree_metadata = resolve_tree_metadata.extend(self)
+
+            with self._profile(resolve_tree_metadata):
+                self._initialize_pools()
+                resolved_provider = self._provide(resolve_tree_metadata)
+
+            self._resolved_provider = resolved_provider
+            return self._resolved_provider
+
+    async def _aresolve(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> T:
+        if self._scope is not None:
+            return await self._aresolve_scoped(resolve_tree_metadata)
+
+        if self._resolved_provider is not None:
+            self._profile_hit(resolve_tree_metadata)
+            return self._resolved_provider
+
+        if self._resolving is None:
+            self._resolving = asyncio.ensure_future(self._aresolve_provider(resolve_tree_metadata.extend(self)))
+        elif resolve_tree_metadata.find_cycle(self) is not None:
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        return await self._await_resolving(self._resolving, resolve_tree_metadata)
 
-        if self._resolved_provider:
+    async def _aresolve_provider(self, resolve_tree_metadata: ResolveTreeMetadata) -> T:
+        try:
+            self._initialize_pools()
+            resolved_provider = await self._aprovide(resolve_tree_metadata)
+            self._resolved_provider = resolved_provider
             return self._resolved_provider
+        finally:
+            self._resolving = None
+
+    def _resolve_scoped(self, resolve_tree_metadata: ResolveTreeMetadata) -> T:
+        scope = self._get_active_scope()
+
+        resolved_provider = scope.get(self)
+        if resolved_provider is not None:
+            self._profile_hit(resolve_tree_metadata)
+            return resolved_provider
+
+        if scope.is_building(self):
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        resolve_tree_metadata = resolve_tree_metadata.extend(self)
+
+        scope.start(self)
+        try:
+            with self._profile(resolve_tree_metadata):
+                self._initialize_pools()
+                resolved_provider = self._provide(resolve_tree_metadata)
+        finally:
+            scope.finish(self)
+
+        scope.set(self, resolved_provider)
+        return resolved_provider
+
+    async def _aresolve_scoped(self, resolve_tree_metadata: ResolveTreeMetadata) -> T:
+        scope = self._get_active_scope()
+
+        resolved_provider = scope.get(self)
+        if resolved_provider is not None:
+            self._profile_hit(resolve_tree_metadata)
+            return resolved_provider
+
+        resolving = scope.get_pending(self)
+        if resolving is None:
+            self._initialize_pools()
+            resolving = scope.set_pending(
+                self,
+                asyncio.ensure_future(self._aprovide(resolve_tree_metadata.extend(self))),
+            )
+        elif resolve_tree_metadata.find_cycle(self) is not None:
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        resolved_provider = await self._await_resolving(resolving, resolve_tree_metadata)
+        scope.set(self, resolved_provider)
+
+        return resolved_provider
+
+    def _register_resource(self, resource: Any) -> None:
+        if self._scope is None:
+            super()._register_resource(resource)
+        else:
+            self._get_active_scope().register_resource(self, resource)
+
+    def _get_active_scope(self) -> Scope:
+        scope = Scope.current(self._scope)
+
+        if scope is None:
+            raise ScopeIsNotActive(f'{self.name} requires an active {self._scope!r} scope')
+
+        return scope
+
+    def _compile(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+    ) -> int:
+        slot = compiler.get_slot(self)
+        if slot is not None:
+            return slot
+
+        if compiler.is_compiling(self):
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        resolve_tree_metadata = resolve_tree_metadata.extend(self)
+        compiler.start(self)
 
         self._initialize_pools()
-        resolved_provider = self._provide(resolve_tree_metadata)
-        self._resolved_provider = resolved_provider
-        return self._resolved_provider
+        return self._compile_step(compiler, resolve_tree_metadata)
+
+    def compile_factory(
+            self,
+            compiler: IPlanCompiler,
+            resolve_tree_metadata: ResolveTreeMetadata = None,
+            kind: DependencyKind = DependencyKind.FACTORY,
+    ) -> int:
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata()
+
+        slot = compiler.get_slot(self, kind)
+        if slot is not None:
+            return slot
+
+        if compiler.is_compiling(self, kind):
+            self._raise_circular_dependency(resolve_tree_metadata)
+
+        resolve_tree_metadata = resolve_tree_metadata.extend(self)
+        compiler.start(self, kind)
+
+        self._initialize_pools()
+        return self._compile_step(compiler, resolve_tree_metadata, kind)
+
+    def make_factory(self, resolve_tree_metadata: ResolveTreeMetadata = None) -> Callable[..., T]:
+        resolve_tree_metadata = resolve_tree_metadata or ResolveTreeMetadata()
+
+        check_transient_factory(self.name, self.factory)
+
+        with self._lock:
+            resolve_tree_metadata = resolve_tree_metadata.extend(self)
+
+            self._initialize_pools()
+            scoped, dependencies_items = self._split_scoped_dependencies(resolve_tree_metadata)
+
+            return bind_factory(self.factory, self._prepare(resolve_tree_metadata, dependencies_items), scoped)
+
+    def _split_scoped_dependencies(
+            self,
+            resolve_tree_metadata: ResolveTreeMetadata,
+    ) -> tuple[dict[str, IProvider], list[tuple[str, Dependency]]]:
+        scoped = {}
+        dependencies_items = []
+
+        for key, dependency in self.dependencies.items():
+            provider = self._get_provider_from_pools(dependency.marker, key, resolve_tree_metadata)
+
+            if dependency.kind is DependencyKind.VALUE and provider.scope is not None:
+                scoped[key] = provider
+            else:
+                dependencies_items.append((key, dependency))
+
+        return scoped, dependencies_items
+
+    def invalidate(self) -> None:
+        self._resolved_provider = None
+        self._pool = None
+
+    def reset_after_fork(self) -> None:
+        super().reset_after_fork()
+
+        if self.after_fork != 'keep':
+            self._resolved_provider = None
+            self._pool = None
+
+    def sizeof(self) -> int:
+        size = super().sizeof()
+
+        if self._resolved_provider is not None:
+            size += sizeof(self._resolved_provider)
+
+        return size
+
+    def get_pool(self) -> Pooled[T]:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = Pooled(Factory(self).create, self.pool_spec)
+
+        return self._pool
 
     def _initialize_pools(self) -> None:
         self._own_providers_pool = self._make_own_providers_pool()
@@ -64,16 +298,38 @@ class Provider[T](AbstractProvider[T]):
             provider.set_providers_pool(child_providers_pool)
 
     def _make_own_providers_pool(self) -> ProvidersPool:
-        pool = ProvidersPool()
-
-        for provider in self._providers:
-            pool.add(provider)
+        if not self._providers:
+            return self._inherit_providers_pool
 
-        return pool
+        return ProvidersPool.from_providers(self._providers, parent=self._inherit_providers_pool)
 
     def _make_child_providers_pool(self) -> ProvidersPool:
-        return self._inherit_providers_pool.copy().merge(self._own_providers_pool)
+        return self._own_providers_pool
+
+    @property
+    def pool_spec(self) -> PoolSpec:
+        return self._pool_spec or PoolSpec()
 
     @property
     def provider_method(self) -> Callable[[*Any], T]:
         return self.class_.__init__ if self._factory is None else self._factory
+
+
+class ResolvedProvider[T](Provider[T]):
+    __slots__ = ()
+
+    def __init__(self, class_: Type[T], instance: T):
+        super().__init__(class_=class_, factory=partial(_return, instance))
+
+        self._resolved_provider = instance
+
+    def invalidate(self) -> None:
+        pass
+
+    @property
+    def dependencies(self) -> dict[str, Dependency]:
+        return {}
+
+
+def _return[T](instance: T) -> T:
+    return instance
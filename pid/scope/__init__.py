@@ -0,0 +1 @@
+from .scope import Scope
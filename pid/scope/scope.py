@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar, Token
+from inspect import isasyncgen
+from typing import Any, Optional
+
+from ..shared import IProvider, UnsupportedFactory, aclose_resource, close_resource
+
+_scope_vars: dict[str, ContextVar[Optional[Scope]]] = {}
+
+
+def _get_scope_var(name: str) -> ContextVar[Optional[Scope]]:
+    scope_var = _scope_vars.get(name)
+
+    if scope_var is None:
+        scope_var = _scope_vars.setdefault(name, ContextVar(f'pid_scope_{name}', default=None))
+
+    return scope_var
+
+
+class Scope:
+    def __init__(self, name: str = 'request'):
+        self.name = name
+
+        self._scope_var = _get_scope_var(name)
+        self._token: Optional[Token] = None
+        self._instances: dict[IProvider, Any] = {}
+        self._pending: dict[IProvider, asyncio.Future] = {}
+        self._building: set[IProvider] = set()
+        self._resources: list[tuple[IProvider, Any]] = []
+
+    @classmethod
+    def current(cls, name: str = 'request') -> Optional[Scope]:
+        return _get_scope_var(name).get()
+
+    def get(self, provider: IProvider) -> Optional[Any]:
+        return self._instances.get(provider)
+
+    def set(self, provider: IProvider, instance: Any) -> None:
+        self._instances[provider] = instance
+        self._pending.pop(provider, None)
+
+    def is_building(self, provider: IProvider) -> bool:
+        return provider in self._building
+
+    def start(self, provider: IProvider) -> None:
+        self._building.add(provider)
+
+    def finish(self, provider: IProvider) -> None:
+        self._building.discard(provider)
+
+    def register_resource(self, provider: IProvider, resource: Any) -> None:
+        self._resources.append((provider, resource))
+
+    def get_pending(self, provider: IProvider) -> Optional[asyncio.Future]:
+        return self._pending.get(provider)
+
+    def set_pending(self, provider: IProvider, resolving: asyncio.Future) -> asyncio.Future:
+        self._pending[provider] = resolving
+        return resolving
+
+    def __enter__(self) -> Scope:
+        self._token = self._scope_var.set(self)
+        return self
+
+    def __exit__(self, _type: Any, error: Optional[BaseException], _traceback: Any) -> None:
+        self._reset()
+
+        errors, unsupported = [], []
+        for provider, resource in self._take_resources():
+            if isasyncgen(resource):
+                unsupported.append(provider.name)
+                continue
+
+            try:
+                close_resource(provider, resource)
+            except Exception as close_error:
+                errors.append(close_error)
+
+        if unsupported:
+            errors.append(UnsupportedFactory(
+                f'Scope {self.name!r} holds async generator resources ({", ".join(unsupported)}), use async with'
+            ))
+
+        self._raise_errors(errors, error)
+
+    async def __aenter__(self) -> Scope:
+        return self.__enter__()
+
+    async def __aexit__(self, _type: Any, error: Optional[BaseException], _traceback: Any) -> None:
+        self._reset()
+
+        errors = []
+        for provider, resource in self._take_resources():
+            try:
+                await aclose_resource(provider, resource)
+            except Exception as close_error:
+                errors.append(close_error)
+
+        self._raise_errors(errors, error)
+
+    def _reset(self) -> None:
+        self._scope_var.reset(self._token)
+        self._token = None
+        self._instances.clear()
+        self._pending.clear()
+        self._building.clear()
+
+    def _take_resources(self) -> list[tuple[IProvider, Any]]:
+        resources, self._resources = self._resources, []
+        return resources[::-1]
+
+    def _raise_errors(self, errors: list[Exception], cause: Optional[BaseException]) -> None:
+        if errors:
+            raise ExceptionGroup(f'Errors while closing {self.name!r} scope', errors) from cause
+
@@ -1,4 +1,6 @@
 from .exceptions import *
 from .interfaces import *
+from .locks import *
 from .shared_types import *
-from .utils import *
+from .stats import *
+from .resources import *
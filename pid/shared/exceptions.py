@@ -3,6 +3,11 @@ __all__ = [
     'UndefinedExport',
     'ClassIsNotInjectable',
     'MultipleProvidersForAlias',
+    'ResolutionDeadlock',
+    'ScopeIsNotActive',
+    'CircularDependency',
+    'PoolExhausted',
+    'UnsupportedFactory',
 ]
 
 
@@ -16,3 +21,18 @@ class ClassIsNotInjectable(Exception): ...
 
 
 class MultipleProvidersForAlias(Exception): ...
+
+
+class ResolutionDeadlock(Exception): ...
+
+
+class ScopeIsNotActive(Exception): ...
+
+
+class CircularDependency(Exception): ...
+
+
+class PoolExhausted(Exception): ...
+
+
+class UnsupportedFactory(Exception): ...
@@ -1,39 +1,95 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Type, Optional
+from typing import Any, Awaitable, Callable, ContextManager, Type, Optional
 
 __all__ = [
     'IProvider',
     'IModule',
     'IMetaData',
+    'IContainer',
+    'IPlanCompiler',
+    'IProfiler',
 ]
 
 
 class IProvider[T]:
+    __slots__ = ()
+
     class_: Any
 
     is_module: bool
     name: str
+    scope: Optional[str]
+    after_fork: str
+    aliases: tuple[Any, ...]
+    providers: tuple[IProvider, ...]
 
     resolve: Callable[[Optional[Any]], T]
+    aresolve: Callable[[Optional[Any]], Awaitable[T]]
+    compile: Callable[[IPlanCompiler, Optional[Any]], int]
+    compile_factory: Callable[[IPlanCompiler, Optional[Any]], int]
+    make_factory: Callable[[Optional[Any]], Callable[..., T]]
+    get_pool: Callable[[], Any]
+    sizeof: Callable[[], int]
+    reset_after_fork: Callable[[], None]
+    invalidate: Callable[[], None]
     set_providers_pool: Callable
 
     provider_method: Callable[[*Any], T]
     factory: Callable[[*Any], T]
+    pool_spec: Any
 
 
 class IModule[T](IProvider[T]):
+    __slots__ = ()
+
     make_exports: Callable
     make_export_providers_pool: Callable
 
 
 class IMetaData[T]:
+    __slots__ = ()
+
     class_: Type[T]
     is_module: bool
     imports: list[Any]
     exports: list[Any]
     providers: list[Any]
+    scope: Optional[str]
+    pool: Optional[Any]
+    after_fork: str
+    aliases: tuple[Any, ...]
 
     name: str
+    provider_method: Callable[[*Any], T]
+    dependencies: dict[str, Any]
+
+    make_providable: Callable[[IContainer], IProvider]
+    make_module: Callable[[IContainer], IModule]
+
+
+class IContainer:
+    manifest: Optional[Any]
+    counters: Optional[Any]
+    overrides: dict[Any, IProvider]
+
+    find_override: Callable[[Any, Any], Optional[IProvider]]
+    has_dependencies: Callable[[IProvider], bool]
+    record_dependencies: Callable[[IProvider, list[tuple[Any, IProvider]]], None]
+    register_resource: Callable[[IProvider, Any], None]
+
+    get_module: Callable[[IMetaData], IModule]
+
+
+class IPlanCompiler:
+    get_slot: Callable[[IProvider, Any], Optional[int]]
+    is_compiling: Callable[[IProvider, Any], bool]
+    start: Callable[[IProvider, Any], None]
+    add_step: Callable[[IProvider, dict[str, int], dict[str, tuple[int, Any]], Any], int]
+
 
-    make_providable: Callable[[], IProvider]
+class IProfiler:
+    measure: Callable[[IProvider, list[Any]], ContextManager]
+    measure_factory: Callable[[], ContextManager]
+    add_lookup_time: Callable[[float], None]
+    hit: Callable[[IProvider], None]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import threading
+from time import perf_counter
+from typing import Optional
+
+from .exceptions import ResolutionDeadlock
+
+__all__ = [
+    'LockStats',
+    'ResolutionLock',
+    'lock_stats',
+]
+
+
+class LockStats:
+    def __init__(self):
+        self.waits = 0
+        self.wait_time = 0.0
+        self.deadlocks = 0
+
+    def reset(self) -> None:
+        self.waits = 0
+        self.wait_time = 0.0
+        self.deadlocks = 0
+
+
+lock_stats = LockStats()
+
+_graph_lock = threading.Lock()
+_waiting: dict[int, ResolutionLock] = {}
+
+
+class ResolutionLock:
+    __slots__ = ('name', 'waits', '_lock', '_owner', '_depth')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.waits = 0
+
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None
+        self._depth = 0
+
+    def reset(self) -> None:
+        self._lock = threading.RLock()
+        self._owner = None
+        self._depth = 0
+
+    def is_owned(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def __enter__(self) -> ResolutionLock:
+        ident = threading.get_ident()
+
+        if not self._lock.acquire(blocking=False):
+            self._wait(ident)
+
+        self._owner = ident
+        self._depth += 1
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._depth -= 1
+        if not self._depth:
+            self._owner = None
+
+        self._lock.release()
+
+    def _wait(self, ident: int) -> None:
+        with _graph_lock:
+            self._check_deadlock(ident)
+            _waiting[ident] = self
+            self.waits += 1
+            lock_stats.waits += 1
+
+        started = perf_counter()
+        try:
+            self._lock.acquire()
+        finally:
+            with _graph_lock:
+                del _waiting[ident]
+                lock_stats.wait_time += perf_counter() - started
+
+    def _check_deadlock(self, ident: int) -> None:
+        cycle = [self]
+        owner = self._owner
+
+        while owner is not None and owner != ident:
+            lock = _waiting.get(owner)
+            if lock is None:
+                return
+
+            cycle.append(lock)
+            owner = lock._owner
+
+        if owner is None:
+            return
+
+        lock_stats.deadlocks += 1
+
+        raise ResolutionDeadlock(
+            'Deadlock while resolving providers in different threads:\n' +
+            ' -> '.join(lock.name for lock in cycle)
+        )
+
+
+def _reset_after_fork() -> None:
+    global _graph_lock
+
+    _graph_lock = threading.Lock()
+    _waiting.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
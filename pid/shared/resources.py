@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+from inspect import isasyncgen
+from typing import Any
+
+from .exceptions import UnsupportedFactory
+from .interfaces import IProvider
+
+__all__ = [
+    'close_resource',
+    'aclose_resource',
+]
+
+
+def close_resource(provider: IProvider, resource: Any) -> None:
+    try:
+        next(resource)
+    except StopIteration:
+        return
+
+    resource.close()
+    raise UnsupportedFactory(f'{provider.name} factory yielded more than once')
+
+
+async def aclose_resource(provider: IProvider, resource: Any) -> None:
+    if not isasyncgen(resource):
+        return await asyncio.to_thread(close_resource, provider, resource)
+
+    try:
+        await anext(resource)
+    except StopAsyncIteration:
+        return
+
+    await resource.aclose()
+    raise UnsupportedFactory(f'{provider.name} factory yielded more than once')
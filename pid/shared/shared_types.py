@@ -1,15 +1,115 @@
-from typing import NamedTuple, Type, Any
+from __future__ import annotations
+
+from asyncio import Semaphore
+from enum import Enum
+from typing import Literal, NamedTuple, Type, Any, Optional
+
+from .interfaces import IProfiler
+from .stats import ContainerStats
 
 __all__ = [
+    'DependencyKind',
     'Dependency',
+    'PoolSpec',
+    'AfterFork',
+    'ResolveChain',
     'ResolveTreeMetadata',
 ]
 
 
+class DependencyKind(Enum):
+    VALUE = 'value'
+    RAW = 'raw'
+    LAZY = 'lazy'
+    FACTORY = 'factory'
+    POOLED = 'pooled'
+
+
 class Dependency(NamedTuple):
-    raw: bool
     marker: Type[Any]
+    kind: DependencyKind = DependencyKind.VALUE
+
+    @property
+    def raw(self) -> bool:
+        return self.kind is DependencyKind.RAW
+
+
+type AfterFork = Literal['keep', 'drop', 'reinit']
+
+
+class PoolSpec(NamedTuple):
+    min: int = 0
+    max: int = 16
+    idle_timeout: Optional[float] = None
+
+    def check(self) -> None:
+        if self.max < 1:
+            raise ValueError(f'pool max must be at least 1, got {self.max}')
+        if not 0 <= self.min <= self.max:
+            raise ValueError(f'pool min must be between 0 and max ({self.max}), got {self.min}')
+        if self.idle_timeout is not None and self.idle_timeout < 0:
+            raise ValueError(f'pool idle_timeout must not be negative, got {self.idle_timeout}')
+
+
+class ResolveChain(NamedTuple):
+    provider: Any
+    parent: Optional[ResolveChain] = None
 
 
 class ResolveTreeMetadata(NamedTuple):
-    chain: list[Any]
+    chain: Optional[ResolveChain] = None
+    limiter: Optional[Semaphore] = None
+    profiler: Optional[IProfiler] = None
+    stats: Optional[ContainerStats] = None
+    waits: Optional[dict[Any, list[Any]]] = None
+
+    def extend(self, provider: Any) -> ResolveTreeMetadata:
+        return ResolveTreeMetadata(
+            ResolveChain(provider, self.chain),
+            self.limiter,
+            self.profiler,
+            self.stats,
+            self.waits,
+        )
+
+    @property
+    def names(self) -> list[str]:
+        names = []
+        node = self.chain
+
+        while node is not None:
+            names.append(node.provider.name)
+            node = node.parent
+
+        return names[::-1]
+
+    def find_cycle(self, provider: Any) -> Optional[list[str]]:
+        names = []
+        node = self.chain
+
+        while node is not None:
+            names.append(node.provider.name)
+            if node.provider is provider:
+                return names[::-1]
+            node = node.parent
+
+        return None
+
+    def find_wait_cycle(self, provider: Any) -> Optional[list[str]]:
+        if self.waits is None or self.chain is None:
+            return None
+
+        waiter = self.chain.provider
+        stack = [(provider, [provider.name])]
+        seen = set()
+
+        while stack:
+            node, names = stack.pop()
+            if node is waiter:
+                return names
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend((awaited, [*names, awaited.name]) for awaited in self.waits.get(node, ()))
+
+        return None
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+__all__ = [
+    'ContainerStats',
+    'sizeof',
+]
+
+
+class ContainerStats:
+    def __init__(self):
+        self.lookups = 0
+        self.lookup_misses = 0
+        self.pools_created = 0
+        self.pools_merged = 0
+        self.resolved = 0
+        self.hits = 0
+
+    def reset(self) -> None:
+        self.lookups = 0
+        self.lookup_misses = 0
+        self.pools_created = 0
+        self.pools_merged = 0
+        self.resolved = 0
+        self.hits = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+def sizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+
+    return size
@@ -1,6 +1,9 @@
+from dataclasses import dataclass
+
 import pytest
 
 from pid import BootStrap, Pid
+from pid.bootstrap.utils import get_metadata
 from pid.shared import CannotResolveDependency, MultipleProvidersForAlias
 
 
@@ -151,3 +154,93 @@ def test_generic_alias_with_different_generic_inverted():
 
     assert isinstance(test_module.provider2, TestProvider2)
     assert issubclass(test_module.provider2.__class__, Interface)
+
+
+def test_alias_reassign_conflicts_with_inherited():
+    class Interface: ...
+
+    @Pid.injectable()
+    class ModuleProvider(Interface): ...
+
+    @Pid.injectable()
+    class ReassignedProvider(Interface): ...
+
+    @Pid.injectable()
+    class Consumer:
+        def __init__(self, provider: Interface):
+            self.provider = provider
+
+    @Pid.injectable(providers=[ReassignedProvider, Consumer])
+    @dataclass
+    class ReassignProvider:
+        consumer: Consumer
+
+    @Pid.module(providers=[ModuleProvider, ReassignProvider])
+    class TestModule:
+        def __init__(self, provider: Interface, reassign: ReassignProvider):
+            self.provider = provider
+            self.reassign = reassign
+
+    with pytest.raises(MultipleProvidersForAlias):
+        BootStrap.resolve(TestModule)
+
+
+def test_intermediate_base_alias():
+    class Interface: ...
+
+    class Base(Interface): ...
+
+    @Pid.injectable()
+    class TestProvider(Base): ...
+
+    @Pid.module(providers=[TestProvider])
+    class TestModule:
+        def __init__(self, provider: Interface, base: Base):
+            self.provider = provider
+            self.base = base
+
+    test_module = BootStrap.resolve(TestModule)
+
+    assert isinstance(test_module.provider, TestProvider)
+    assert test_module.provider is test_module.base
+
+
+def test_substituted_generic_alias():
+    class Model: ...
+
+    class Interface[T]: ...
+
+    class Base[T](Interface[T]): ...
+
+    @Pid.injectable()
+    class TestProvider(Base[Model]): ...
+
+    @Pid.module(providers=[TestProvider])
+    class TestModule:
+        def __init__(self, provider: Interface[Model]):
+            self.provider = provider
+
+    test_module = BootStrap.resolve(TestModule)
+
+    assert isinstance(test_module.provider, TestProvider)
+    assert get_metadata(TestProvider).aliases == (TestProvider, Base[Model], Interface[Model])
+
+
+def test_alias_own_provider_conflicts_with_import():
+    class Interface: ...
+
+    @Pid.injectable()
+    class ImportedProvider(Interface): ...
+
+    @Pid.injectable()
+    class OwnProvider(Interface): ...
+
+    @Pid.module(providers=[ImportedProvider], exports=[ImportedProvider])
+    class ImportedModule: ...
+
+    @Pid.module(imports=[ImportedModule], providers=[OwnProvider])
+    class TestModule:
+        def __init__(self, provider: Interface): ...
+
+    with pytest.raises(MultipleProvidersForAlias):
+        BootStrap.resolve(TestModule)
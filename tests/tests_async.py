@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from pid import BootStrap, Pid
+from pid.shared import UnsupportedFactory
+
+
+class TestsAsync:
+
+    def test_async_factory(self):
+        async def factory():
+            await asyncio.sleep(0)
+            return TestProvider('test_string')
+
+        @Pid.injectable(factory=factory)
+        class TestProvider(str): ...
+
+        @Pid.module(providers=[TestProvider])
+        class AsyncFactoryModule:
+            def __init__(self, provider: TestProvider):
+                self.provider = provider
+
+        test_module = asyncio.run(BootStrap.aresolve(AsyncFactoryModule))
+
+        assert test_module.provider == 'test_string'
+
+    def test_concurrent_siblings(self):
+        __events__ = []
+
+        def make_factory(name, class_):
+            async def factory():
+                __events__.append(f'start {name}')
+                await asyncio.sleep(0.01)
+                __events__.append(f'end {name}')
+                return class_()
+            return factory
+
+        class First: ...
+
+        class Second: ...
+
+        Pid.injectable(factory=make_factory('first', First))(First)
+        Pid.injectable(factory=make_factory('second', Second))(Second)
+
+        @Pid.module(providers=[First, Second])
+        class AsyncSiblingsModule:
+            def __init__(self, first: First, second: Second): ...
+
+        asyncio.run(BootStrap.aresolve(AsyncSiblingsModule))
+
+        assert __events__ == ['start first', 'start second', 'end first', 'end second']
+
+    def test_concurrency_limit(self):
+        __events__ = []
+
+        def make_factory(name, class_):
+            async def factory():
+                __events__.append(f'start {name}')
+                await asyncio.sleep(0.01)
+                __events__.append(f'end {name}')
+                return class_()
+            return factory
+
+        class First: ...
+
+        class Second: ...
+
+        Pid.injectable(factory=make_factory('first', First))(First)
+        Pid.injectable(factory=make_factory('second', Second))(Second)
+
+        @Pid.module(providers=[First, Second])
+        class AsyncLimitedModule:
+            def __init__(self, first: First, second: Second): ...
+
+        asyncio.run(BootStrap.aresolve(AsyncLimitedModule, concurrency=1))
+
+        assert __events__ == ['start first', 'end first', 'start second', 'end second']
+
+    def test_shared_dependency_constructed_once(self):
+        __store__ = {'constructed': 0}
+
+        async def factory():
+            __store__['constructed'] += 1
+            await asyncio.sleep(0.01)
+            return SharedProvider()
+
+        @Pid.injectable(factory=factory)
+        class SharedProvider: ...
+
+        @Pid.injectable()
+        class LeftProvider:
+            def __init__(self, shared: SharedProvider):
+                self.shared = shared
+
+        @Pid.injectable()
+        class RightProvider:
+            def __init__(self, shared: SharedProvider):
+                self.shared = shared
+
+        @Pid.module(providers=[SharedProvider, LeftProvider, RightProvider])
+        class AsyncSharedModule:
+            def __init__(self, left: LeftProvider, right: RightProvider):
+                self.left = left
+                self.right = right
+
+        test_module = asyncio.run(BootStrap.aresolve(AsyncSharedModule))
+
+        assert __store__['constructed'] == 1
+        assert test_module.left.shared is test_module.right.shared
+
+    def test_async_factory_sync_resolve(self):
+        async def factory():
+            return AsyncOnlyProvider()
+
+        @Pid.injectable(factory=factory)
+        class AsyncOnlyProvider: ...
+
+        @Pid.module(providers=[AsyncOnlyProvider])
+        class AsyncOnlyModule:
+            def __init__(self, provider: AsyncOnlyProvider): ...
+
+        with pytest.raises(UnsupportedFactory, match='aresolve'):
+            BootStrap.resolve(AsyncOnlyModule)
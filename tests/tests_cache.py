@@ -0,0 +1,95 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+from pid import BootStrap, Container, GraphCache, Pid
+from pid.bootstrap.utils import get_metadata
+
+GRAPH_SOURCE = '''
+from pid import Pid
+
+
+@Pid.injectable()
+class CachedProvider: ...
+
+
+@Pid.injectable()
+class CachedConsumer:
+    def __init__(self, provider: CachedProvider):
+        self.provider = provider
+
+
+@Pid.module(providers=[CachedProvider, CachedConsumer])
+class CachedModule:
+    def __init__(self, consumer: CachedConsumer):
+        self.consumer = consumer
+'''
+
+
+@pytest.fixture
+def graph(tmp_path):
+    (tmp_path / 'cached_graph.py').write_text(GRAPH_SOURCE)
+    sys.path.insert(0, str(tmp_path))
+
+    yield importlib.import_module('cached_graph')
+
+    sys.path.remove(str(tmp_path))
+    del sys.modules['cached_graph']
+
+
+def forget_dependencies(graph):
+    for class_ in (graph.CachedModule, graph.CachedConsumer, graph.CachedProvider):
+        get_metadata(class_).dependencies = None
+
+
+class TestsCache:
+
+    def test_cache_roundtrip(self, graph, tmp_path):
+        cache = GraphCache(tmp_path / 'cache')
+
+        assert not cache.load(graph.CachedModule)
+
+        test_module = BootStrap.resolve(graph.CachedModule, cache=cache)
+        assert isinstance(test_module.consumer.provider, graph.CachedProvider)
+
+        forget_dependencies(graph)
+
+        assert cache.load(graph.CachedModule)
+        assert get_metadata(graph.CachedConsumer)._dependencies['provider'].marker is graph.CachedProvider
+
+    def test_cache_stale(self, graph, tmp_path):
+        cache = GraphCache(tmp_path / 'cache')
+        cache.save(graph.CachedModule)
+
+        stat = os.stat(graph.__file__)
+        os.utime(graph.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert not cache.load(graph.CachedModule)
+
+    def test_cache_local_classes(self, tmp_path):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module(providers=[TestProvider])
+        class TestModule:
+            def __init__(self, provider: TestProvider):
+                self.provider = provider
+
+        cache = GraphCache(tmp_path / 'cache')
+
+        assert not cache.save(TestModule)
+        assert isinstance(BootStrap.resolve(TestModule, cache=cache).provider, TestProvider)
+
+    def test_cache_with_container(self, graph, tmp_path):
+        with pytest.raises(ValueError):
+            BootStrap.resolve(graph.CachedModule, container=Container(), cache=GraphCache(tmp_path / 'cache'))
+
+    def test_cache_unwritable(self, graph, tmp_path):
+        (tmp_path / 'file').write_text('')
+        cache = GraphCache(tmp_path / 'file' / 'cache')
+
+        assert not cache.load(graph.CachedModule)
+        assert not cache.save(graph.CachedModule)
+        assert isinstance(BootStrap.resolve(graph.CachedModule, cache=cache).consumer, graph.CachedConsumer)
@@ -3,7 +3,8 @@ from dataclasses import dataclass
 import pytest
 
 from pid.shared import CannotResolveDependency, UndefinedExport, ClassIsNotInjectable
-from pid import BootStrap, Pid, Provider
+from pid import BootStrap, Container, Pid, Provider
+from pid.bootstrap.utils import get_metadata
 
 
 class TestsCombinations:
@@ -300,6 +301,28 @@ class TestsCombinations:
         assert __store__['inherited_provider'] is __store__['export_provider_one']
         assert __store__['export_provider_two'] is not __store__['export_provider_one']
 
+    def test_exports_cached(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.injectable()
+        class OtherProvider: ...
+
+        @Pid.module(providers=[TestProvider], exports=[TestProvider])
+        class ExportModule: ...
+
+        container = Container()
+        export_module = container.get_module(get_metadata(ExportModule))
+        export_module.resolve()
+
+        export_pool = export_module.make_export_providers_pool()
+
+        assert export_module.make_export_providers_pool() is export_pool
+
+        export_module._own_providers_pool.add(Provider(OtherProvider))
+
+        assert export_module.make_export_providers_pool() is not export_pool
+
 
 class TestsErrors:
 
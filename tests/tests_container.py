@@ -0,0 +1,104 @@
+import gc
+import weakref
+
+from pid import BootStrap, Container, Pid
+
+
+def make_module(value):
+    @Pid.injectable(factory=lambda: TestProvider(value))
+    class TestProvider(str): ...
+
+    @Pid.module(providers=[TestProvider])
+    class TestModule:
+        def __init__(self, provider: TestProvider):
+            self.provider = provider
+
+    return TestModule
+
+
+class TestsContainer:
+
+    def test_same_module_in_one_container(self):
+        @Pid.module()
+        class SharedModule: ...
+
+        container = Container()
+
+        assert container.resolve(SharedModule) is container.resolve(SharedModule)
+
+    def test_independent_containers(self):
+        @Pid.module()
+        class SharedModule: ...
+
+        assert Container().resolve(SharedModule) is not Container().resolve(SharedModule)
+
+    def test_same_name_does_not_collide(self):
+        first_module, second_module = make_module('first'), make_module('second')
+        container = Container()
+
+        assert container.resolve(first_module).provider == 'first'
+        assert container.resolve(second_module).provider == 'second'
+
+    def test_container_is_collected(self):
+        test_module = BootStrap.resolve(make_module('collected'))
+        reference = weakref.ref(test_module)
+
+        del test_module
+        gc.collect()
+
+        assert reference() is None
+
+
+class TestsContainerStats:
+
+    def test_stats_counters(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.injectable()
+        class OtherProvider:
+            def __init__(self, provider: TestProvider): ...
+
+        @Pid.module(providers=[TestProvider, OtherProvider])
+        class StatsModule:
+            def __init__(self, provider: TestProvider, other: OtherProvider): ...
+
+        container = Container(stats=True)
+        BootStrap.resolve(StatsModule, container=container)
+
+        stats = container.stats()
+
+        assert stats['resolved'] == 3
+        assert stats['hits'] == 1
+        assert stats['lookups'] == 3
+        assert stats['lookup_misses'] == 0
+        assert stats['pools_created'] > 0
+        assert stats['pools_merged'] == 0
+        assert stats['modules'] == 1
+        assert stats['wrappers'] == 3
+        assert stats['footprint']['StatsModule'] > 0
+
+    def test_stats_merged_pools(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module(providers=[TestProvider], exports=[TestProvider])
+        class ExportModule: ...
+
+        @Pid.module(imports=[ExportModule])
+        class ImportModule:
+            def __init__(self, provider: TestProvider): ...
+
+        container = Container(stats=True)
+        BootStrap.resolve(ImportModule, container=container)
+
+        assert container.stats()['pools_merged'] == 1
+
+    def test_stats_disabled(self):
+        container = Container()
+        BootStrap.resolve(make_module('value'), container=container)
+
+        stats = container.stats()
+
+        assert 'lookups' not in stats
+        assert stats['modules'] == 1
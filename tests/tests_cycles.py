@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from pid import BootStrap, Pid, Provider, Scope
+from pid.bootstrap.utils import get_metadata
+from pid.shared import CircularDependency
+
+
+@Pid.injectable()
+class CycleFirst:
+    def __init__(self, second: 'CycleSecond'): ...
+
+
+@Pid.injectable()
+class CycleSecond:
+    def __init__(self, first: CycleFirst): ...
+
+
+@Pid.module(providers=[CycleFirst, CycleSecond])
+class CycleModule:
+    def __init__(self, first: CycleFirst): ...
+
+
+@Pid.injectable()
+class SiblingSecond:
+    def __init__(self, third: 'SiblingThird'): ...
+
+
+@Pid.injectable()
+class SiblingThird:
+    def __init__(self, second: SiblingSecond): ...
+
+
+@Pid.module(providers=[SiblingSecond, SiblingThird])
+class SiblingModule:
+    def __init__(self, second: SiblingSecond, third: SiblingThird): ...
+
+
+@Pid.injectable(scope='request')
+class SelfResolving:
+    def __init__(self, handle: Provider['SelfResolving']):
+        handle.resolve()
+
+
+@Pid.module(providers=[SelfResolving])
+class SelfResolvingModule:
+    def __init__(self, handle: Provider[SelfResolving]):
+        self.handle = handle
+
+
+class TestsCycles:
+
+    def test_provider_cycle(self):
+        with pytest.raises(CircularDependency) as error:
+            BootStrap.resolve(CycleModule)
+
+        assert 'CycleFirst -> CycleSecond -> CycleFirst' in str(error.value)
+        assert '^- CycleModule' in str(error.value)
+
+    def test_provider_cycle_async(self):
+        with pytest.raises(CircularDependency):
+            asyncio.run(BootStrap.aresolve(CycleModule))
+
+    def test_sibling_cycle_async(self):
+        with pytest.raises(CircularDependency) as error:
+            asyncio.run(asyncio.wait_for(BootStrap.aresolve(SiblingModule), timeout=5))
+
+        assert 'SiblingSecond -> SiblingThird -> SiblingSecond' in str(error.value)
+
+    def test_provider_cycle_compile(self):
+        with pytest.raises(CircularDependency):
+            BootStrap.compile(CycleModule)
+
+    def test_scoped_cycle(self):
+        test_module = BootStrap.resolve(SelfResolvingModule)
+
+        with Scope(), pytest.raises(CircularDependency):
+            test_module.handle.resolve()
+
+    def test_module_import_cycle(self):
+        @Pid.module()
+        class FirstModule: ...
+
+        @Pid.module(imports=[FirstModule])
+        class SecondModule: ...
+
+        get_metadata(FirstModule).imports = [SecondModule]
+
+        with pytest.raises(CircularDependency) as error:
+            BootStrap.resolve(FirstModule)
+
+        assert 'FirstModule -> SecondModule -> FirstModule' in str(error.value)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pid import BootStrap, Pid, Provider
+from pid.bootstrap.utils import get_metadata
+
+
+@Pid.injectable()
+class ForwardReferenceConsumer:
+    def __init__(self, service: ForwardReferenceService, handle: Provider[ForwardReferenceService]):
+        self.service = service
+        self.handle = handle
+
+
+@Pid.injectable()
+class ForwardReferenceService: ...
+
+
+@Pid.module(providers=[ForwardReferenceConsumer, ForwardReferenceService])
+class ForwardReferenceModule:
+    def __init__(self, consumer: ForwardReferenceConsumer):
+        self.consumer = consumer
+
+
+def test_forward_reference():
+    test_module = BootStrap.resolve(ForwardReferenceModule)
+
+    assert isinstance(test_module.consumer.service, ForwardReferenceService)
+    assert test_module.consumer.handle.resolve() is test_module.consumer.service
+
+
+def test_dependencies_are_cached():
+    metadata = get_metadata(ForwardReferenceConsumer)
+
+    assert metadata.dependencies is metadata.dependencies
+    assert metadata.dependencies['handle'].raw
+    assert metadata.dependencies['service'].marker is ForwardReferenceService
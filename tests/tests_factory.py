@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from pid import BootStrap, Factory, Pid, Scope
+from pid.shared import UnsupportedFactory
+
+
+class TestsFactory:
+
+    def test_factory_creates_new_instances(self):
+        @Pid.injectable()
+        class Connection: ...
+
+        @Pid.injectable()
+        class Message:
+            def __init__(self, connection: Connection, body=''):
+                self.connection = connection
+                self.body = body
+
+        @Pid.module(providers=[Connection, Message])
+        class FactoryModule:
+            def __init__(self, messages: Factory[Message], connection: Connection):
+                self.messages = messages
+                self.connection = connection
+
+        test_module = BootStrap.resolve(FactoryModule)
+
+        first = test_module.messages.create()
+        second = test_module.messages.create(body='hello')
+
+        assert first is not second
+        assert first.connection is second.connection is test_module.connection
+        assert second.body == 'hello'
+
+    def test_factory_create_many(self):
+        @Pid.injectable()
+        class Message: ...
+
+        @Pid.module(providers=[Message])
+        class FactoryManyModule:
+            def __init__(self, messages: Factory[Message]):
+                self.messages = messages
+
+        messages = BootStrap.resolve(FactoryManyModule).messages.create_many(3)
+
+        assert len(messages) == 3
+        assert len({id(message) for message in messages}) == 3
+
+    def test_factory_async(self):
+        @Pid.injectable()
+        class Message: ...
+
+        @Pid.module(providers=[Message])
+        class FactoryAsyncModule:
+            def __init__(self, messages: Factory[Message]):
+                self.messages = messages
+
+        test_module = asyncio.run(BootStrap.aresolve(FactoryAsyncModule))
+
+        assert isinstance(test_module.messages.create(), Message)
+
+    def test_factory_in_plan(self):
+        @Pid.injectable()
+        class Connection: ...
+
+        @Pid.injectable()
+        class Message:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+        @Pid.module(providers=[Connection, Message])
+        class FactoryPlanModule:
+            def __init__(self, messages: Factory[Message], connection: Connection):
+                self.messages = messages
+                self.connection = connection
+
+        test_module = BootStrap.compile(FactoryPlanModule).run()
+
+        first, second = test_module.messages.create_many(2)
+
+        assert first is not second
+        assert first.connection is test_module.connection
+
+    def test_factory_resolves_scoped_dependencies_per_create(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.injectable()
+        class Command:
+            def __init__(self, unit_of_work: UnitOfWork):
+                self.unit_of_work = unit_of_work
+
+        @Pid.module(providers=[UnitOfWork, Command])
+        class FactoryScopeModule:
+            def __init__(self, commands: Factory[Command]):
+                self.commands = commands
+
+        for test_module in (BootStrap.resolve(FactoryScopeModule), BootStrap.compile(FactoryScopeModule).run()):
+            with Scope():
+                first = test_module.commands.create()
+                assert test_module.commands.create().unit_of_work is first.unit_of_work
+
+            with Scope():
+                second = test_module.commands.create()
+
+            assert second.unit_of_work is not first.unit_of_work
+
+    def test_factory_rejects_resource_factory(self):
+        def factory():
+            yield Connection()
+
+        @Pid.injectable(factory=factory)
+        class Connection: ...
+
+        @Pid.module(providers=[Connection])
+        class FactoryResourceModule:
+            def __init__(self, connections: Factory[Connection]):
+                self.connections = connections
+
+        test_module = BootStrap.resolve(FactoryResourceModule)
+
+        with pytest.raises(UnsupportedFactory):
+            test_module.connections.create()
+
+        with pytest.raises(UnsupportedFactory):
+            BootStrap.compile(FactoryResourceModule)
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from pid import BootStrap, Container, Pid, Provider
+from pid.bootstrap.utils import get_metadata
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+
+
+def run_in_child(check):
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        try:
+            os.write(write_end, b'1' if check() else b'0')
+        finally:
+            os._exit(0)
+
+    os.close(write_end)
+    result = os.read(read_end, 1)
+    os.close(read_end)
+    os.waitpid(pid, 0)
+
+    return result == b'1'
+
+
+class TestsFork:
+
+    def test_after_fork_policies(self):
+        __store__ = {'reinit': 0, 'drop': 0}
+
+        @Pid.injectable()
+        class SharedProvider: ...
+
+        @Pid.injectable(after_fork='reinit')
+        class SocketProvider:
+            def __init__(self):
+                __store__['reinit'] += 1
+
+        @Pid.injectable(after_fork='drop')
+        class ThreadPoolProvider:
+            def __init__(self):
+                __store__['drop'] += 1
+
+        @Pid.module(providers=[SharedProvider, SocketProvider, ThreadPoolProvider])
+        class ForkModule:
+            def __init__(
+                    self,
+                    shared: SharedProvider,
+                    socket: Provider[SocketProvider],
+                    thread_pool: Provider[ThreadPoolProvider],
+            ):
+                self.shared = shared
+                self.socket = socket
+                self.thread_pool = thread_pool
+
+        container = Container()
+        test_module = BootStrap.resolve(ForkModule, container=container)
+
+        shared = test_module.shared
+        socket = test_module.socket.resolve()
+        test_module.thread_pool.resolve()
+
+        def check():
+            reinitialized = __store__['reinit'] == 2 and test_module.socket._resolved_provider is not None
+            dropped = __store__['drop'] == 1 and test_module.thread_pool._resolved_provider is None
+            rebuilt = test_module.thread_pool.resolve() is not None and __store__['drop'] == 2
+
+            return (
+                reinitialized and dropped and rebuilt
+                and test_module.socket.resolve() is not socket
+                and container.get_module(get_metadata(ForkModule)).resolve() is test_module
+                and test_module.shared is shared
+            )
+
+        assert run_in_child(check)
+        assert test_module.socket.resolve() is socket
+        assert __store__ == {'reinit': 1, 'drop': 1}
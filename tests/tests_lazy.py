@@ -0,0 +1,82 @@
+from pid import BootStrap, Pid, Lazy
+from pid.lazy import unwrap
+
+
+class TestsLazy:
+
+    def test_lazy_defers_construction(self):
+        __store__ = {'constructed': 0}
+
+        @Pid.injectable()
+        class HeavyProvider:
+            def __init__(self):
+                __store__['constructed'] += 1
+
+            def generate(self):
+                return 'report'
+
+        @Pid.module(providers=[HeavyProvider])
+        class LazyModule:
+            def __init__(self, heavy: Lazy[HeavyProvider]):
+                self.heavy = heavy
+
+        test_module = BootStrap.resolve(LazyModule)
+
+        assert __store__['constructed'] == 0
+        assert test_module.heavy.generate() == 'report'
+        assert test_module.heavy.generate() == 'report'
+        assert __store__['constructed'] == 1
+        assert isinstance(unwrap(test_module.heavy), HeavyProvider)
+
+    def test_lazy_shares_singleton(self):
+        @Pid.injectable()
+        class HeavyProvider: ...
+
+        @Pid.module(providers=[HeavyProvider])
+        class LazySharedModule:
+            def __init__(self, heavy: Lazy[HeavyProvider], eager: HeavyProvider):
+                self.heavy = heavy
+                self.eager = eager
+
+        test_module = BootStrap.resolve(LazySharedModule)
+
+        assert unwrap(test_module.heavy) is test_module.eager
+
+    def test_lazy_in_plan(self):
+        @Pid.injectable()
+        class HeavyProvider: ...
+
+        @Pid.module(providers=[HeavyProvider])
+        class LazyPlanModule:
+            def __init__(self, heavy: Lazy[HeavyProvider], eager: HeavyProvider):
+                self.heavy = heavy
+                self.eager = eager
+
+        test_module = BootStrap.compile(LazyPlanModule).run()
+
+        assert unwrap(test_module.heavy) is test_module.eager
+
+    def test_lazy_defers_construction_in_plan(self):
+        __store__ = {'constructed': 0}
+
+        @Pid.injectable()
+        class HeavyDependency:
+            def __init__(self):
+                __store__['constructed'] += 1
+
+        @Pid.injectable()
+        class HeavyProvider:
+            def __init__(self, dependency: HeavyDependency):
+                __store__['constructed'] += 1
+
+        @Pid.module(providers=[HeavyDependency, HeavyProvider])
+        class LazyDeferredPlanModule:
+            def __init__(self, heavy: Lazy[HeavyProvider]):
+                self.heavy = heavy
+
+        test_module = BootStrap.compile(LazyDeferredPlanModule).run()
+
+        assert __store__['constructed'] == 0
+        assert isinstance(unwrap(test_module.heavy), HeavyProvider)
+        assert unwrap(test_module.heavy) is unwrap(test_module.heavy)
+        assert __store__['constructed'] == 2
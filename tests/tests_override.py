@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pid import BootStrap, Container, Pid, Provider, Scope
+
+
+class Repository: ...
+
+
+@Pid.injectable()
+class SqlRepository(Repository): ...
+
+
+@Pid.injectable()
+class FakeRepository(Repository): ...
+
+
+@Pid.injectable()
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+@Pid.injectable()
+class Controller:
+    def __init__(self, service: Service):
+        self.service = service
+
+
+@Pid.injectable()
+class Clock: ...
+
+
+@Pid.injectable()
+class AuditedRepository(Repository):
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+@Pid.module(providers=[SqlRepository, Service, Controller, Clock])
+class AppModule:
+    def __init__(self, controller: Controller, clock: Clock):
+        self.controller = controller
+        self.clock = clock
+
+
+class TestsOverride:
+
+    def test_override_rebuilds_dependents_only(self):
+        container = Container()
+        app = BootStrap.resolve(AppModule, container=container)
+
+        container.override(Repository, FakeRepository)
+        overridden = container.resolve(AppModule)
+
+        assert overridden is not app
+        assert isinstance(overridden.controller.service.repository, FakeRepository)
+        assert overridden.controller is not app.controller
+        assert overridden.clock is app.clock
+
+    def test_override_context_manager(self):
+        container = Container()
+        app = BootStrap.resolve(AppModule, container=container)
+        fake = FakeRepository()
+
+        with container.override(Repository, fake):
+            assert container.resolve(AppModule).controller.service.repository is fake
+
+        restored = container.resolve(AppModule)
+
+        assert isinstance(restored.controller.service.repository, SqlRepository)
+        assert restored.controller.service.repository is app.controller.service.repository
+        assert restored.clock is app.clock
+
+    def test_override_before_resolve(self):
+        container = Container()
+
+        with container.override(Repository, FakeRepository):
+            app = BootStrap.resolve(AppModule, container=container)
+
+            assert isinstance(app.controller.service.repository, FakeRepository)
+
+    def test_override_instance_in_plan(self):
+        container = Container()
+        BootStrap.resolve(AppModule, container=container)
+        fake = FakeRepository()
+
+        with container.override(Repository, fake):
+            assert container.compile(AppModule).run().controller.service.repository is fake
+
+            with ThreadPoolExecutor(2) as executor:
+                app = container.resolve(AppModule, executor=executor)
+
+            assert app.controller.service.repository is fake
+
+    def test_override_with_dependencies_before_resolve(self):
+        container = Container()
+
+        with container.override(Repository, AuditedRepository):
+            app = BootStrap.resolve(AppModule, container=container)
+
+            assert isinstance(app.controller.service.repository, AuditedRepository)
+            assert app.controller.service.repository.clock is app.clock
+
+    def test_override_async_graph(self):
+        async def make_service(repository: Repository) -> Service:
+            await asyncio.sleep(0)
+            return Service(repository)
+
+        @Pid.injectable(factory=make_service)
+        class AsyncService(Service): ...
+
+        @Pid.module(providers=[SqlRepository, AsyncService])
+        class AsyncModule:
+            def __init__(self, service: AsyncService):
+                self.service = service
+
+        async def main():
+            container = Container()
+            await BootStrap.aresolve(AsyncModule, container=container)
+
+            with container.override(Repository, FakeRepository):
+                app = await container.aresolve(AsyncModule)
+
+            return app
+
+        assert isinstance(asyncio.run(main()).service.repository, FakeRepository)
+
+    def test_override_closes_invalidated_resources(self):
+        __events__ = []
+
+        class Session: ...
+
+        def make_session(repository: Repository):
+            __events__.append('open')
+            yield Session()
+            __events__.append('close')
+
+        Pid.injectable(factory=make_session)(Session)
+
+        @Pid.module(providers=[SqlRepository, Session])
+        class SessionModule:
+            def __init__(self, session: Session):
+                self.session = session
+
+        container = Container()
+        BootStrap.resolve(SessionModule, container=container)
+
+        with container.override(Repository, FakeRepository):
+            assert __events__ == ['open', 'close']
+
+            container.resolve(SessionModule)
+
+        assert __events__ == ['open', 'close', 'open', 'close']
+        assert len(container._resources) == 0
+
+    def test_dependencies_recorded_once(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork:
+            def __init__(self, clock: Clock): ...
+
+        @Pid.module(providers=[Clock, UnitOfWork])
+        class ScopedModule:
+            def __init__(self, unit_of_work: Provider[UnitOfWork]):
+                self.unit_of_work = unit_of_work
+
+        container = Container()
+        test_module = BootStrap.resolve(ScopedModule, container=container)
+        recorded = []
+        record_dependencies = container.record_dependencies
+        container.record_dependencies = lambda *args: recorded.append(args) or record_dependencies(*args)
+
+        for _ in range(3):
+            with Scope():
+                test_module.unit_of_work.resolve()
+
+        assert len({dependent for dependent, _ in recorded}) == len(recorded) == 2
@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pid import BootStrap, Container, Pid, Provider
+from pid.shared import CannotResolveDependency
+
+
+class TestsPlan:
+
+    def test_rhombus(self):
+        __store__ = {}
+
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module(providers=[TestProvider], exports=[TestProvider])
+        class PlanTopModule:
+            def __init__(self, provider: TestProvider):
+                __store__['common_provider'] = provider
+
+        @Pid.module(imports=[PlanTopModule])
+        class PlanRightModule:
+            def __init__(self, provider: TestProvider):
+                __store__['right_provider'] = provider
+
+        @Pid.module(imports=[PlanTopModule])
+        class PlanLeftModule:
+            def __init__(self, provider: TestProvider):
+                __store__['left_provider'] = provider
+
+        @Pid.module(imports=[PlanRightModule, PlanLeftModule])
+        class PlanRhombusModule: ...
+
+        plan = BootStrap.compile(PlanRhombusModule)
+        plan.run()
+
+        assert len(plan.steps) == 5
+        assert __store__['common_provider'] is __store__['left_provider']
+        assert __store__['common_provider'] is __store__['right_provider']
+
+    def test_reassign(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.injectable(providers=[TestProvider])
+        class ReassignProvider:
+            def __init__(self, provider: TestProvider):
+                self.provider = provider
+
+        @Pid.module(providers=[TestProvider, ReassignProvider])
+        class PlanReassignModule:
+            def __init__(self, provider: TestProvider, reassign: ReassignProvider):
+                self.provider = provider
+                self.reassign = reassign
+
+        test_module = BootStrap.compile(PlanReassignModule).run()
+
+        assert test_module.provider is not test_module.reassign.provider
+
+    def test_runs_are_independent(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module(providers=[TestProvider])
+        class PlanIndependentModule:
+            def __init__(self, provider: TestProvider, handle: Provider[TestProvider]):
+                self.provider = provider
+                self.handle = handle
+
+        plan = BootStrap.compile(PlanIndependentModule)
+        first, second = plan.run(), plan.run()
+
+        assert first.provider is not second.provider
+        assert first.handle.resolve() is first.provider
+
+    def test_executor(self):
+        __store__ = {'constructed': 0}
+        barrier = threading.Barrier(2, timeout=5)
+
+        @Pid.injectable()
+        class SharedProvider:
+            def __init__(self):
+                __store__['constructed'] += 1
+
+        @Pid.injectable()
+        class LeftProvider:
+            def __init__(self, shared: SharedProvider):
+                barrier.wait()
+                self.shared = shared
+
+        @Pid.injectable()
+        class RightProvider:
+            def __init__(self, shared: SharedProvider):
+                barrier.wait()
+                self.shared = shared
+
+        @Pid.module(providers=[SharedProvider, LeftProvider, RightProvider])
+        class PlanExecutorModule:
+            def __init__(self, left: LeftProvider, right: RightProvider):
+                self.left = left
+                self.right = right
+
+        with ThreadPoolExecutor(2) as executor:
+            test_module = BootStrap.resolve(PlanExecutorModule, executor=executor)
+
+        assert __store__['constructed'] == 1
+        assert test_module.left.shared is test_module.right.shared
+
+    def test_unresolved_dependency(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module()
+        class PlanUnresolvedModule:
+            def __init__(self, provider: TestProvider): ...
+
+        with pytest.raises(CannotResolveDependency):
+            BootStrap.compile(PlanUnresolvedModule)
+
+    def test_executor_fills_container(self):
+        __store__ = {'constructed': 0}
+
+        @Pid.injectable()
+        class SharedProvider:
+            def __init__(self):
+                __store__['constructed'] += 1
+
+        @Pid.module(providers=[SharedProvider])
+        class ContainerExecutorModule:
+            def __init__(self, shared: SharedProvider):
+                self.shared = shared
+
+        container = Container()
+
+        with ThreadPoolExecutor(2) as executor:
+            first = container.resolve(ContainerExecutorModule, executor=executor)
+
+        assert container.resolve(ContainerExecutorModule) is first
+        assert __store__['constructed'] == 1
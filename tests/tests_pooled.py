@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pid import BootStrap, Pid, Pooled, PoolSpec
+from pid.shared import PoolExhausted, UnsupportedFactory
+
+
+class TestsPooled:
+
+    def test_pool_reuses_instances(self):
+        @Pid.injectable()
+        class Buffer: ...
+
+        @Pid.injectable()
+        class Parser:
+            def __init__(self, buffer: Buffer):
+                self.buffer = buffer
+
+        @Pid.module(providers=[Buffer, Parser])
+        class PoolModule:
+            def __init__(self, parsers: Pooled[Parser], buffer: Buffer):
+                self.parsers = parsers
+                self.buffer = buffer
+
+        test_module = BootStrap.resolve(PoolModule)
+
+        with test_module.parsers.acquire() as first:
+            with test_module.parsers.acquire() as second:
+                assert first is not second
+                assert first.buffer is second.buffer is test_module.buffer
+
+        with test_module.parsers.acquire() as third:
+            assert third is first
+
+        assert test_module.parsers.stats.misses == 2
+        assert test_module.parsers.stats.hits == 1
+
+    def test_pool_shared_between_consumers(self):
+        @Pid.injectable(pool=PoolSpec(min=2, max=2))
+        class Parser: ...
+
+        @Pid.injectable()
+        class Consumer:
+            def __init__(self, parsers: Pooled[Parser]):
+                self.parsers = parsers
+
+        @Pid.module(providers=[Parser, Consumer])
+        class SharedPoolModule:
+            def __init__(self, parsers: Pooled[Parser], consumer: Consumer):
+                self.parsers = parsers
+                self.consumer = consumer
+
+        test_module = BootStrap.resolve(SharedPoolModule)
+
+        assert test_module.parsers is test_module.consumer.parsers
+
+        with test_module.parsers.acquire():
+            assert test_module.parsers.size == 2
+            assert test_module.parsers.idle == 1
+
+    def test_pool_bounded_threads(self):
+        pool = Pooled(object, PoolSpec(max=1))
+        acquired = threading.Event()
+        results = []
+
+        def hold():
+            with pool.acquire() as instance:
+                results.append(instance)
+                acquired.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait()
+
+        with pool.acquire() as instance:
+            results.append(instance)
+
+        thread.join()
+
+        assert results[0] is results[1]
+        assert pool.size == 1
+        assert pool.stats.waits == 1
+
+    def test_pool_timeout(self):
+        pool = Pooled(object, PoolSpec(max=1))
+
+        with pool.acquire(), pytest.raises(PoolExhausted):
+            with pool.acquire(timeout=0.01):
+                pass
+
+        with pool.acquire():
+            assert pool.size == 1
+
+    @pytest.mark.parametrize('spec', [PoolSpec(min=3, max=2), PoolSpec(max=0), PoolSpec(idle_timeout=-1)])
+    def test_pool_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            Pid.injectable(pool=spec)
+
+        with pytest.raises(ValueError):
+            Pooled(object, spec)
+
+    def test_pool_async(self):
+        pool = Pooled(object, PoolSpec(max=2))
+        active = []
+        peak = []
+
+        async def work():
+            async with pool.aacquire() as instance:
+                active.append(instance)
+                peak.append(len(active))
+                await asyncio.sleep(0.01)
+                active.remove(instance)
+
+        async def main():
+            await asyncio.gather(*(work() for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert max(peak) == 2
+        assert pool.size == 2
+        assert pool.stats.waits == 4
+
+    def test_pool_idle_timeout(self):
+        pool = Pooled(object, PoolSpec(min=1, max=2, idle_timeout=0.01))
+
+        with pool.acquire(), pool.acquire():
+            pass
+
+        time.sleep(0.02)
+
+        with pool.acquire():
+            assert pool.stats.evicted == 1
+            assert pool.size == 1
+
+    def test_pool_in_plan(self):
+        @Pid.injectable(pool=PoolSpec(max=1))
+        class Parser: ...
+
+        @Pid.module(providers=[Parser])
+        class PoolPlanModule:
+            def __init__(self, parsers: Pooled[Parser]):
+                self.parsers = parsers
+
+        test_module = BootStrap.compile(PoolPlanModule).run()
+
+        with test_module.parsers.acquire() as parser:
+            assert isinstance(parser, Parser)
+        assert test_module.parsers.spec.max == 1
+
+    def test_pool_rejects_resource_factory(self):
+        async def factory():
+            yield Parser()
+
+        @Pid.injectable(factory=factory)
+        class Parser: ...
+
+        @Pid.module(providers=[Parser])
+        class PoolResourceModule:
+            def __init__(self, parsers: Pooled[Parser]):
+                self.parsers = parsers
+
+        test_module = BootStrap.resolve(PoolResourceModule)
+
+        with pytest.raises(UnsupportedFactory):
+            with test_module.parsers.acquire():
+                pass
@@ -0,0 +1,64 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pid import BootStrap, Pid, Profiler
+
+
+class TestsProfiler:
+
+    def test_profile_tree(self):
+        @Pid.injectable()
+        class SlowProvider:
+            def __init__(self):
+                time.sleep(0.01)
+
+        @Pid.injectable()
+        class ConsumerProvider:
+            def __init__(self, slow: SlowProvider):
+                self.slow = slow
+
+        @Pid.module(providers=[SlowProvider, ConsumerProvider])
+        class ProfiledModule:
+            def __init__(self, consumer: ConsumerProvider, slow: SlowProvider): ...
+
+        profiler = Profiler()
+        BootStrap.resolve(ProfiledModule, profiler=profiler)
+
+        [root] = profiler.roots
+        [consumer] = root.children
+        [slow] = consumer.children
+
+        assert root.name == 'ProfiledModule'
+        assert slow.factory_time >= 0.01
+        assert consumer.dependencies_time >= 0.01
+        assert slow.chain == ('ProfiledModule', 'ConsumerProvider', 'SlowProvider')
+        assert profiler.hits['SlowProvider'] == 1
+
+        report = profiler.report()
+        assert report.splitlines()[1].endswith('SlowProvider')
+
+    def test_chrome_trace(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        @Pid.module(providers=[TestProvider])
+        class TracedModule:
+            def __init__(self, provider: TestProvider): ...
+
+        profiler = Profiler()
+        BootStrap.resolve(TracedModule, profiler=profiler)
+
+        trace = json.loads(json.dumps(profiler.to_chrome_trace()))
+
+        assert {event['name'] for event in trace['traceEvents']} == {'TracedModule', 'TestProvider'}
+        assert all(event['ph'] == 'X' for event in trace['traceEvents'])
+
+    def test_profiler_with_executor(self):
+        @Pid.module()
+        class ProfiledPlanModule: ...
+
+        with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError):
+            BootStrap.resolve(ProfiledPlanModule, executor=executor, profiler=Profiler())
@@ -0,0 +1,119 @@
+import sys
+
+import pytest
+
+from pid import BootStrap, Container, GraphCache, Manifest, Pid
+from pid.bootstrap.utils import resolve_reference
+from pid.shared import ClassIsNotInjectable, MultipleProvidersForAlias
+
+PACKAGE_SOURCES = {
+    '__init__.py': '',
+    'billing.py': '''
+from pid import Pid
+
+
+class IBilling: ...
+
+
+@Pid.injectable()
+class BillingProvider(IBilling): ...
+''',
+    'reports.py': '''
+from pid import Pid
+
+
+@Pid.injectable()
+class ReportsProvider: ...
+''',
+    'root.py': '''
+from pid import Pid
+
+
+@Pid.module(providers=['lazy_app.billing:BillingProvider', 'lazy_app.reports:ReportsProvider'])
+class RootModule:
+    def __init__(self, billing: 'IBilling'):
+        self.billing = billing
+
+
+from lazy_app.billing import IBilling
+''',
+}
+
+
+def forget_lazy_app():
+    for name in [name for name in sys.modules if name.startswith('lazy_app')]:
+        del sys.modules[name]
+
+    resolve_reference.cache_clear()
+
+
+@pytest.fixture
+def lazy_app(tmp_path):
+    package = tmp_path / 'lazy_app'
+    package.mkdir()
+    for name, source in PACKAGE_SOURCES.items():
+        (package / name).write_text(source)
+
+    sys.path.insert(0, str(tmp_path))
+
+    yield 'lazy_app.root:RootModule'
+
+    sys.path.remove(str(tmp_path))
+    forget_lazy_app()
+
+
+class TestsReferences:
+
+    def test_string_references(self, lazy_app):
+        test_module = BootStrap.resolve(lazy_app)
+
+        assert type(test_module.billing).__name__ == 'BillingProvider'
+        assert 'lazy_app.reports' in sys.modules
+
+    def test_manifest_defers_imports(self, lazy_app, tmp_path):
+        manifest_path = tmp_path / 'manifest.json'
+        Manifest.build(lazy_app).save(manifest_path)
+
+        forget_lazy_app()
+
+        container = Container(manifest=Manifest.load(manifest_path))
+        test_module = BootStrap.resolve(lazy_app, container=container)
+
+        assert type(test_module.billing).__name__ == 'BillingProvider'
+        assert 'lazy_app.reports' not in sys.modules
+
+    def test_unknown_reference(self):
+        @Pid.module(providers=['missing_package.module:Provider'])
+        class TestModule: ...
+
+        with pytest.raises(ClassIsNotInjectable):
+            BootStrap.resolve(TestModule)
+
+    def test_cache_keeps_references_deferred(self, lazy_app, tmp_path):
+        manifest_path = tmp_path / 'manifest.json'
+        Manifest.build(lazy_app).save(manifest_path)
+
+        forget_lazy_app()
+
+        container = Container(cache=GraphCache(tmp_path / 'cache'), manifest=Manifest.load(manifest_path))
+        BootStrap.resolve(lazy_app, container=container)
+
+        assert 'lazy_app.reports' not in sys.modules
+
+    def test_manifest_alias_conflict(self, lazy_app, tmp_path):
+        manifest_path = tmp_path / 'manifest.json'
+        Manifest.build(lazy_app).save(manifest_path)
+
+        from lazy_app.billing import IBilling
+
+        @Pid.injectable()
+        class LocalBilling(IBilling): ...
+
+        @Pid.module(providers=[LocalBilling, 'lazy_app.billing:BillingProvider'])
+        class ConflictModule:
+            def __init__(self, billing: IBilling): ...
+
+        container = Container(manifest=Manifest.load(manifest_path))
+
+        with pytest.raises(MultipleProvidersForAlias):
+            BootStrap.resolve(ConflictModule, container=container)
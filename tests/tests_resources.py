@@ -0,0 +1,211 @@
+import asyncio
+import time
+
+import pytest
+
+from pid import BootStrap, Container, Pid, Provider, Scope
+from pid.shared import UnsupportedFactory
+
+
+class TestsResources:
+
+    def test_close_in_reverse_dependency_order(self):
+        __events__ = []
+
+        class Database: ...
+
+        class Repository: ...
+
+        def make_database():
+            yield Database()
+            __events__.append('close database')
+
+        def make_repository(database: Database):
+            yield Repository()
+            __events__.append('close repository')
+
+        Pid.injectable(factory=make_database)(Database)
+        Pid.injectable(factory=make_repository)(Repository)
+
+        @Pid.module(providers=[Database, Repository])
+        class ResourcesModule:
+            def __init__(self, repository: Repository):
+                self.repository = repository
+
+        container = Container()
+        test_module = BootStrap.resolve(ResourcesModule, container=container)
+
+        assert isinstance(test_module.repository, Repository)
+        assert __events__ == []
+
+        container.close()
+
+        assert __events__ == ['close repository', 'close database']
+
+    def test_close_rebuilds_on_next_resolve(self):
+        __created__ = []
+
+        def factory():
+            __created__.append(1)
+            yield Connection()
+
+        @Pid.injectable(factory=factory)
+        class Connection: ...
+
+        @Pid.module(providers=[Connection])
+        class ConnectionModule:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+        container = Container()
+        first = BootStrap.resolve(ConnectionModule, container=container).connection
+        container.close()
+        second = container.resolve(Connection)
+
+        assert first is not second
+        assert len(__created__) == 2
+
+    def test_aclose_tears_down_branches_concurrently(self):
+        __events__ = []
+
+        def make_factory(name, class_):
+            async def factory():
+                yield class_()
+                __events__.append(f'start {name}')
+                await asyncio.sleep(0.01)
+                __events__.append(f'end {name}')
+            return factory
+
+        class First: ...
+
+        class Second: ...
+
+        Pid.injectable(factory=make_factory('first', First))(First)
+        Pid.injectable(factory=make_factory('second', Second))(Second)
+
+        @Pid.module(providers=[First, Second])
+        class BranchesModule:
+            def __init__(self, first: First, second: Second): ...
+
+        async def main():
+            container = Container()
+            await BootStrap.aresolve(BranchesModule, container=container)
+            await container.aclose()
+
+        asyncio.run(main())
+
+        assert __events__ == ['start first', 'start second', 'end first', 'end second']
+
+    def test_close_timeout(self):
+        def factory():
+            yield Slow()
+            time.sleep(0.2)
+
+        @Pid.injectable(factory=factory)
+        class Slow: ...
+
+        @Pid.module(providers=[Slow])
+        class SlowModule:
+            def __init__(self, slow: Slow): ...
+
+        container = Container()
+        BootStrap.resolve(SlowModule, container=container)
+
+        with pytest.raises(ExceptionGroup) as error:
+            container.close(timeout=0.01)
+
+        assert error.group_contains(TimeoutError, match='Slow')
+
+    def test_close_timeout_per_resource(self):
+        __closed__ = []
+
+        def make_factory(class_):
+            def factory():
+                yield class_()
+                time.sleep(0.3)
+                __closed__.append(class_)
+            return factory
+
+        classes = [type(f'Resource{index}', (), {}) for index in range(40)]
+        for class_ in classes:
+            Pid.injectable(factory=make_factory(class_))(class_)
+
+        @Pid.module(providers=classes)
+        class ManyResourcesModule: ...
+
+        container = Container()
+        BootStrap.resolve(ManyResourcesModule, container=container, warm='eager')
+        container.close(timeout=0.5)
+
+        assert len(__closed__) == 40
+
+    def test_scoped_resource_closed_on_scope_exit(self):
+        __events__ = []
+
+        def factory():
+            yield Session()
+            __events__.append('close session')
+
+        @Pid.injectable(factory=factory, scope='request')
+        class Session: ...
+
+        @Pid.module(providers=[Session])
+        class SessionModule:
+            def __init__(self, session: Provider[Session]):
+                self.session = session
+
+        container = Container()
+        test_module = BootStrap.resolve(SessionModule, container=container)
+
+        for closed in range(3):
+            with Scope():
+                test_module.session.resolve()
+                assert len(__events__) == closed
+
+        assert __events__ == ['close session'] * 3
+
+        async def main():
+            async with Scope():
+                await test_module.session.aresolve()
+
+        asyncio.run(main())
+
+        assert len(__events__) == 4
+        assert container._resources == []
+
+    def test_scope_exit_closes_sync_resources_before_rejecting_async(self):
+        __events__ = []
+
+        def make_session():
+            yield Session()
+            __events__.append('close session')
+
+        async def make_stream():
+            yield Stream()
+
+        @Pid.injectable(factory=make_session, scope='request')
+        class Session: ...
+
+        @Pid.injectable(factory=make_stream, scope='request')
+        class Stream: ...
+
+        @Pid.module(providers=[Session, Stream])
+        class MixedModule:
+            def __init__(self, session: Provider[Session], stream: Provider[Stream]):
+                self.session = session
+                self.stream = stream
+
+        test_module = BootStrap.resolve(MixedModule)
+
+        async def main():
+            with Scope():
+                await test_module.session.aresolve()
+                await test_module.stream.aresolve()
+                raise KeyError('in flight')
+
+        with pytest.raises(ExceptionGroup) as error:
+            asyncio.run(main())
+
+        assert error.group_contains(UnsupportedFactory, match='Stream')
+        assert isinstance(error.value.__cause__, KeyError)
+        assert __events__ == ['close session']
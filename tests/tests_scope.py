@@ -0,0 +1,116 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pid import BootStrap, Pid, Provider, Scope
+from pid.shared import ScopeIsNotActive
+
+
+class TestsScope:
+
+    def test_request_scope(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.module(providers=[UnitOfWork])
+        class ScopeModule:
+            def __init__(self, unit_of_work: Provider[UnitOfWork]):
+                self.unit_of_work = unit_of_work
+
+        test_module = BootStrap.resolve(ScopeModule)
+
+        with Scope():
+            first = test_module.unit_of_work.resolve()
+            assert test_module.unit_of_work.resolve() is first
+
+        with Scope():
+            second = test_module.unit_of_work.resolve()
+
+        assert first is not second
+
+    def test_nested_scope(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.module(providers=[UnitOfWork])
+        class NestedScopeModule:
+            def __init__(self, unit_of_work: Provider[UnitOfWork]):
+                self.unit_of_work = unit_of_work
+
+        test_module = BootStrap.resolve(NestedScopeModule)
+
+        with Scope():
+            outer = test_module.unit_of_work.resolve()
+
+            with Scope():
+                assert test_module.unit_of_work.resolve() is not outer
+
+            assert test_module.unit_of_work.resolve() is outer
+
+    def test_scope_is_not_active(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.module(providers=[UnitOfWork])
+        class InactiveScopeModule:
+            def __init__(self, unit_of_work: Provider[UnitOfWork]):
+                self.unit_of_work = unit_of_work
+
+        test_module = BootStrap.resolve(InactiveScopeModule)
+
+        with pytest.raises(ScopeIsNotActive):
+            test_module.unit_of_work.resolve()
+
+    def test_async_scope(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.module(providers=[UnitOfWork])
+        class AsyncScopeModule:
+            def __init__(self, unit_of_work: Provider[UnitOfWork]):
+                self.unit_of_work = unit_of_work
+
+        async def handle(unit_of_work):
+            async with Scope():
+                first, second = await asyncio.gather(unit_of_work.aresolve(), unit_of_work.aresolve())
+                assert first is second
+                return first
+
+        async def main():
+            test_module = await BootStrap.aresolve(AsyncScopeModule)
+            return await asyncio.gather(handle(test_module.unit_of_work), handle(test_module.unit_of_work))
+
+        first, second = asyncio.run(main())
+
+        assert first is not second
+
+    def test_scope_in_plan(self):
+        @Pid.injectable(scope='request')
+        class UnitOfWork: ...
+
+        @Pid.injectable()
+        class Handler:
+            def __init__(self, unit_of_work: UnitOfWork):
+                self.unit_of_work = unit_of_work
+
+        @Pid.module(providers=[UnitOfWork, Handler])
+        class PlanScopeModule:
+            def __init__(self, handler: Handler, unit_of_work: Provider[UnitOfWork]):
+                self.handler = handler
+                self.unit_of_work = unit_of_work
+
+        plan = BootStrap.compile(PlanScopeModule)
+
+        with pytest.raises(ScopeIsNotActive):
+            plan.run()
+
+        with Scope():
+            first = plan.run()
+            assert first.unit_of_work.resolve() is first.handler.unit_of_work
+            assert plan.run().handler.unit_of_work is first.handler.unit_of_work
+
+        with Scope(), ThreadPoolExecutor(2) as executor:
+            second = plan.run(executor=executor)
+
+        assert second.handler.unit_of_work is not first.handler.unit_of_work
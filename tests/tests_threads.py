@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from pid import Container, Pid
+from pid.bootstrap.utils import get_metadata
+from pid.shared import CircularDependency, ResolutionDeadlock, lock_stats
+
+
+class TestsThreads:
+
+    def test_singleton_constructed_once(self):
+        __store__ = {'constructed': 0}
+        started = threading.Event()
+
+        def factory():
+            __store__['constructed'] += 1
+            started.set()
+            time.sleep(0.05)
+            return TestProvider()
+
+        @Pid.injectable(factory=factory)
+        class TestProvider: ...
+
+        provider = get_metadata(TestProvider).make_providable(Container())
+        results = []
+
+        def resolve():
+            results.append(provider.resolve())
+
+        waits = lock_stats.waits
+        first = threading.Thread(target=resolve)
+        first.start()
+        started.wait()
+        second = threading.Thread(target=resolve)
+        second.start()
+        first.join()
+        second.join()
+
+        assert __store__['constructed'] == 1
+        assert results[0] is results[1]
+        assert lock_stats.waits > waits
+
+    def test_deadlock_detected(self):
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+        errors = []
+
+        def first_factory():
+            if not first_entered.is_set():
+                first_entered.set()
+                second_entered.wait()
+                second_provider.resolve()
+            return FirstProvider()
+
+        def second_factory():
+            if not second_entered.is_set():
+                second_entered.set()
+                first_entered.wait()
+                first_provider.resolve()
+            return SecondProvider()
+
+        @Pid.injectable(factory=first_factory)
+        class FirstProvider: ...
+
+        @Pid.injectable(factory=second_factory)
+        class SecondProvider: ...
+
+        first_provider = get_metadata(FirstProvider).make_providable(Container())
+        second_provider = get_metadata(SecondProvider).make_providable(Container())
+
+        def resolve(provider):
+            try:
+                provider.resolve()
+            except ResolutionDeadlock as error:
+                errors.append(error)
+
+        threads = [
+            threading.Thread(target=resolve, args=(first_provider,)),
+            threading.Thread(target=resolve, args=(second_provider,)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(errors) == 1
+        assert 'FirstProvider' in str(errors[0]) and 'SecondProvider' in str(errors[0])
+
+    def test_reentrant_resolution(self):
+        @Pid.injectable()
+        class TestProvider: ...
+
+        provider = get_metadata(TestProvider).make_providable(Container())
+
+        with provider._lock:
+            with provider._lock:
+                assert provider._lock.is_owned()
+
+            with pytest.raises(CircularDependency):
+                provider.resolve()
+
+        assert isinstance(provider.resolve(), TestProvider)
+
+        with pytest.raises(RuntimeError):
+            provider._lock._lock.release()
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+from pid import BootStrap, Container, Pid, Provider
+
+
+class TestsWarm:
+
+    def test_warm_eager(self):
+        __store__ = {}
+
+        @Pid.injectable()
+        class UnusedProvider:
+            def __init__(self):
+                __store__['unused'] = self
+
+        @Pid.module(providers=[UnusedProvider])
+        class WarmModule: ...
+
+        BootStrap.resolve(WarmModule)
+        assert 'unused' not in __store__
+
+        BootStrap.resolve(WarmModule, warm='eager')
+        assert 'unused' in __store__
+
+    def test_warm_background(self):
+        __store__ = {'constructed': 0}
+        release = threading.Event()
+
+        def factory():
+            release.wait(5)
+            __store__['constructed'] += 1
+            return SlowProvider()
+
+        @Pid.injectable(factory=factory)
+        class SlowProvider: ...
+
+        @Pid.injectable(scope='request')
+        class ScopedProvider: ...
+
+        @Pid.module(providers=[SlowProvider, ScopedProvider])
+        class WarmBackgroundModule:
+            def __init__(self, slow: Provider[SlowProvider]):
+                self.slow = slow
+
+        container = Container()
+        test_module = BootStrap.resolve(WarmBackgroundModule, container=container, warm='background')
+
+        assert not container.ready.done()
+
+        release.set()
+        container.ready.result(timeout=5)
+
+        assert isinstance(test_module.slow.resolve(), SlowProvider)
+        assert __store__['constructed'] == 1
+
+    def test_warm_skips_scoped_subtree(self):
+        @Pid.injectable()
+        class NestedDependency: ...
+
+        @Pid.injectable()
+        class NestedProvider:
+            def __init__(self, dependency: NestedDependency): ...
+
+        @Pid.injectable(scope='request', providers=[NestedDependency, NestedProvider])
+        class ScopedProvider:
+            def __init__(self, nested: NestedProvider): ...
+
+        @Pid.module(providers=[ScopedProvider])
+        class WarmScopedModule: ...
+
+        BootStrap.resolve(WarmScopedModule, warm='eager')
+
+        container = Container()
+        BootStrap.resolve(WarmScopedModule, container=container, warm='background')
+        container.ready.result(timeout=5)
+
+        async def main():
+            container = Container()
+            await BootStrap.aresolve(WarmScopedModule, container=container, warm='background')
+            await container.ready
+
+        asyncio.run(main())
+
+    def test_warm_background_async(self):
+        __store__ = {}
+
+        @Pid.injectable()
+        class UnusedProvider:
+            def __init__(self):
+                __store__['unused'] = self
+
+        @Pid.module(providers=[UnusedProvider])
+        class WarmAsyncModule: ...
+
+        async def main():
+            container = Container()
+            await BootStrap.aresolve(WarmAsyncModule, container=container, warm='background')
+            await container.ready
+
+        asyncio.run(main())
+
+        assert 'unused' in __store__